@@ -0,0 +1 @@
+"""Benchmarks for the Loggamera integration."""
@@ -0,0 +1,82 @@
+"""Benchmark the temperature extractor against BeautifulSoup.
+
+Run from the repository root:
+
+    python -m benchmarks.parser --repeat 200 --output parser.json
+
+Each saved page in tests/fixtures is parsed as saved and with padding
+after the reading, like the real page. One JSON object per page and
+parser is printed to stdout; BeautifulSoup is skipped if not installed.
+"""
+
+import argparse
+import importlib.util
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from custom_components.loggamera.parser import extract_temperature
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+PADDINGS = (0, 65536)
+
+
+def _beautifulsoup_temperature(html: str) -> float | None:
+    """Find the temperature the way the integration did before the extractor."""
+    from bs4 import BeautifulSoup
+
+    for element in BeautifulSoup(html, "html.parser").find_all(class_="display-value"):
+        match = re.search(r"([-+]?\d*\.?\d+)", element.get_text().strip())
+        if match and -5 <= float(match.group(1)) <= 40:
+            return float(match.group(1))
+    return None
+
+
+def _time(parse, html: str, repeat: int) -> dict:
+    """Parse a page repeatedly and return the time per page."""
+    started = time.process_time()
+    for _ in range(repeat):
+        temperature = parse(html)
+    per_page = (time.process_time() - started) / repeat
+    return {"temperature": temperature, "us_per_page": round(per_page * 1_000_000, 1)}
+
+
+def run(repeat: int) -> list[dict]:
+    """Time every parser on every page and return the results."""
+    parsers = {"extractor": extract_temperature}
+    if importlib.util.find_spec("bs4") is None:
+        sys.stderr.write("beautifulsoup4 is not installed, only timing the extractor\n")
+    else:
+        parsers["beautifulsoup"] = _beautifulsoup_temperature
+
+    results = []
+    for path in sorted(FIXTURES.glob("*.html")):
+        page = path.read_text(encoding="utf-8")
+        for padding in PADDINGS:
+            html = page.replace("</body>", f"<!-- {'x' * padding} --></body>")
+            for name, parse in parsers.items():
+                row = {"page": path.name, "page_bytes": len(html.encode()), "parser": name, **_time(parse, html, repeat)}
+                results.append(row)
+                sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+                sys.stdout.flush()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the parser benchmark."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.parser", description="Benchmark the temperature extractor against BeautifulSoup.")
+    parser.add_argument("--repeat", type=int, default=200, help="Times each page is parsed.")
+    parser.add_argument("--output", help="Also write all results to this file as a JSON list.")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
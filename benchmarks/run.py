@@ -0,0 +1,207 @@
+"""Benchmark polling against the local portal simulator.
+
+Run from the repository root:
+
+    python -m benchmarks.run --ids 200 --latency 20 --output bench.json
+
+Each scenario prints one JSON object per line to stdout; with --output
+all results are also written to a file as a JSON list, for comparing
+runs.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import aiohttp
+
+from custom_components.loggamera.client import InFlightRegistry, LoggameraClient, async_fetch_temperature, create_session
+from custom_components.loggamera.metrics import RollingWindow
+from custom_components.loggamera.ratelimit import TokenBucket
+from tests.portal import PortalSimulator
+
+CONCURRENCY_LEVELS = (1, 4, 16, 64)
+PAGE_PADDINGS = (0, 65536, 524288)
+
+
+async def _poll(portal: PortalSimulator, sensor_ids: list[int], concurrency: int, limiter: TokenBucket | None = None) -> dict:
+    """Fetch every id once and return throughput and latency figures."""
+    client = LoggameraClient(create_session(), url=portal.url, limiter=limiter or TokenBucket(rate=None))
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = RollingWindow(len(sensor_ids))
+    failed = 0
+
+    async def fetch(sensor_id: int) -> None:
+        nonlocal failed
+        async with semaphore:
+            await client.limiter.acquire()
+            started = time.perf_counter()
+            try:
+                if await async_fetch_temperature(client, sensor_id, acquired=True) is None:
+                    failed += 1
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                failed += 1
+            latencies.add((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(fetch(sensor_id) for sensor_id in sensor_ids))
+    finally:
+        await client.close()
+    elapsed = time.perf_counter() - started
+    summary = latencies.summary()
+    return {
+        "ids": len(sensor_ids),
+        "failed": failed,
+        "seconds": round(elapsed, 3),
+        "ids_per_second": round(len(sensor_ids) / elapsed, 1),
+        "p50_ms": summary["p50"],
+        "p95_ms": summary["p95"],
+        "p99_ms": summary["p99"],
+    }
+
+
+async def _single_flight(portal: PortalSimulator, callers: int) -> dict:
+    """Fetch one id from many callers at once and count upstream requests."""
+    client = LoggameraClient(create_session(), url=portal.url, limiter=TokenBucket(rate=None))
+    registry = InFlightRegistry()
+    sent = len(portal.requests)
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(
+            registry.run(22, lambda: async_fetch_temperature(client, 22)) for _ in range(callers)
+        ))
+    finally:
+        await client.close()
+    return {
+        "callers": callers,
+        "upstream_requests": len(portal.requests) - sent,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+async def _coordinator_refreshes(portal: PortalSimulator, sensor_ids: list[int], refreshes: int, parse_in_executor: bool) -> list[dict]:
+    """Refresh a coordinator repeatedly and return CPU, memory and loop figures per refresh.
+
+    Every other refresh serves changed pages, so the rest are answered
+    from the response cache. Each refresh runs twice, once for its CPU
+    time and once under tracemalloc for its peak memory, as tracing
+    slows everything down; both runs of a changed refresh get new pages.
+    CPU time includes the simulator, which runs in the same process.
+    """
+    from datetime import timedelta
+    from homeassistant.core import HomeAssistant
+    from custom_components.loggamera.coordinator import LoggameraDataCoordinator
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        client = LoggameraClient(create_session(), url=portal.url, limiter=TokenBucket(rate=None))
+        client.inflight.freshness = 0
+        coordinator = LoggameraDataCoordinator(
+            hass,
+            client,
+            sensor_ids,
+            timedelta(minutes=5),
+            max_concurrent=16,
+            parse_in_executor=parse_in_executor,
+            portal_url=portal.url,
+        )
+        rows = []
+        try:
+            for refresh in range(refreshes):
+                pages_changed = refresh % 2 == 0
+                if pages_changed:
+                    portal.temperatures = {sensor_id: 10 + refresh / 10 for sensor_id in sensor_ids}
+
+                started = time.process_time()
+                await coordinator.async_refresh()
+                cpu_seconds = time.process_time() - started
+                loop_blocked = coordinator.loop_blocked_seconds
+
+                if pages_changed:
+                    portal.temperatures = {sensor_id: 10.05 + refresh / 10 for sensor_id in sensor_ids}
+                tracemalloc.start()
+                try:
+                    await coordinator.async_refresh()
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+
+                rows.append({
+                    "refresh": refresh,
+                    "pages_changed": pages_changed,
+                    "status": coordinator.status,
+                    "cpu_ms_per_sensor": round(cpu_seconds * 1000 / len(sensor_ids), 3),
+                    "loop_blocked_ms": round(loop_blocked * 1000, 1),
+                    "peak_kib": round(peak / 1024),
+                })
+        finally:
+            await client.close()
+            portal.temperatures = {}
+        return rows
+
+
+async def async_run(ids: int, latency: float, rate: float, burst: int, error_rate: float, refreshes: int) -> list[dict]:
+    """Run all scenarios and return their results."""
+    portal = PortalSimulator(latency=latency)
+    await portal.start()
+    sensor_ids = list(range(1, ids + 1))
+    results = []
+
+    def report(scenario: str, **result) -> None:
+        row = {"scenario": scenario, **result}
+        results.append(row)
+        sys.stdout.write(json.dumps(row) + "\n")
+        sys.stdout.flush()
+
+    try:
+        for concurrency in CONCURRENCY_LEVELS:
+            report("concurrency", concurrency=concurrency, **await _poll(portal, sensor_ids, concurrency))
+
+        limiter = TokenBucket(rate, burst)
+        report("rate_limit", rate=rate, burst=burst, **await _poll(portal, sensor_ids, 16, limiter))
+
+        for padding in PAGE_PADDINGS:
+            portal.padding = padding
+            report("page_size", page_bytes=padding, **await _poll(portal, sensor_ids, 16))
+        portal.padding = 0
+
+        portal.error_rate = error_rate
+        report("error_rate", error_rate=error_rate, **await _poll(portal, sensor_ids, 16))
+        portal.error_rate = 0.0
+
+        report("single_flight", **await _single_flight(portal, 100))
+
+        for parse_in_executor in (False, True):
+            for row in await _coordinator_refreshes(portal, sensor_ids, refreshes, parse_in_executor):
+                report("coordinator", parse_in_executor=parse_in_executor, **row)
+    finally:
+        await portal.stop()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Benchmark polling against a local portal simulator.")
+    parser.add_argument("--ids", type=int, default=200, help="Ids polled per scenario.")
+    parser.add_argument("--latency", type=float, default=20, help="Simulated portal latency in milliseconds.")
+    parser.add_argument("--rate", type=float, default=50, help="Requests per second in the rate_limit scenario.")
+    parser.add_argument("--burst", type=int, default=10, help="Burst in the rate_limit scenario.")
+    parser.add_argument("--error-rate", type=float, default=0.1, help="Share of failed requests in the error_rate scenario.")
+    parser.add_argument("--refreshes", type=int, default=4, help="Coordinator refreshes in the coordinator scenario.")
+    parser.add_argument("--output", help="Also write all results to this file as a JSON list.")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(async_run(args.ids, args.latency / 1000, args.rate, args.burst, args.error_rate, args.refreshes))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Replay periodic portal updates against the adaptive poll scheduler.
+
+Run from the repository root:
+
+    python -m benchmarks.scheduler --hours 48 --output scheduler.json
+
+A simulated sensor publishes a new reading every ``cadence`` seconds,
+give or take ``jitter``. Polling at the fixed base interval is compared
+with AdaptivePollScheduler on the same updates: how many polls each
+update costs, and how long after an update it is first seen. Time is
+simulated, so a replay of days takes well under a second.
+"""
+
+import argparse
+import json
+import random
+import sys
+
+from custom_components.loggamera.const import DEFAULT_SCAN_INTERVAL
+from custom_components.loggamera.scheduler import AdaptivePollScheduler
+
+CADENCES = (600, 1800, 3600)
+
+
+def _updates(cadence: float, jitter: float, duration: float, seed: int) -> list[float]:
+    """Return the times a sensor publishes a new reading."""
+    rng = random.Random(seed)
+    times = []
+    published = rng.uniform(0, cadence)
+    while published < duration:
+        times.append(published)
+        published += cadence + rng.uniform(-jitter, jitter)
+    return times
+
+
+def _replay(updates: list[float], duration: float, next_poll) -> dict:
+    """Poll until duration and return polls per update and detection lag.
+
+    ``next_poll(now, value)`` is called after each poll with the number
+    of updates published so far and returns the time of the next poll.
+    """
+    polls = 0
+    seen = 0
+    lags = []
+    now = 0.0
+    while now < duration:
+        polls += 1
+        published = sum(1 for update in updates if update <= now)
+        if published > seen:
+            # Only the newest update is seen; the ones before it were missed
+            lags.append(now - updates[published - 1])
+            seen = published
+        now = next_poll(now, published)
+    return {
+        "updates": len(updates),
+        "polls": polls,
+        "polls_per_update": round(polls / len(updates), 2) if updates else None,
+        "missed_updates": len(updates) - len(lags),
+        "mean_lag_s": round(sum(lags) / len(lags), 1) if lags else None,
+        "max_lag_s": round(max(lags), 1) if lags else None,
+    }
+
+
+def run(hours: float, base_interval: float, jitter: float, seed: int) -> list[dict]:
+    """Replay every cadence with fixed and adaptive polling and return the results."""
+    duration = hours * 3600
+    results = []
+    for cadence in CADENCES:
+        updates = _updates(cadence, jitter, duration, seed)
+        scheduler = AdaptivePollScheduler(base_interval)
+
+        def adaptive(now: float, value: int) -> float:
+            scheduler.record_success(1, value, now)
+            return now + scheduler.next_refresh_in([1], now)
+
+        for mode, next_poll in (
+            ("fixed", lambda now, value: now + base_interval),
+            ("adaptive", adaptive),
+        ):
+            row = {"cadence_s": cadence, "mode": mode, **_replay(updates, duration, next_poll)}
+            results.append(row)
+            sys.stdout.write(json.dumps(row) + "\n")
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the scheduler replay."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scheduler", description="Replay periodic updates against fixed and adaptive polling.")
+    parser.add_argument("--hours", type=float, default=48, help="Simulated time per replay.")
+    parser.add_argument("--interval", type=float, default=DEFAULT_SCAN_INTERVAL, help="Base polling interval in seconds.")
+    parser.add_argument("--jitter", type=float, default=30, help="Seconds each update may come early or late.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the update jitter.")
+    parser.add_argument("--output", help="Also write all results to this file as a JSON list.")
+    args = parser.parse_args(argv)
+
+    results = run(args.hours, args.interval, args.jitter, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,78 +4,304 @@ Retrieves temperature data from Loggamera IoT platform.
 """
 
 import logging
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
-from homeassistant.exceptions import ConfigEntryNotReady
+import time
+from typing import TYPE_CHECKING
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    DEFAULT_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_PARSE_IN_EXECUTOR,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_EXTRACT_ALL_VALUES,
+    DEFAULT_COLLECT_METRICS,
+    DEFAULT_PROFILE_STARTUP,
+    DEFAULT_DERIVED_SENSORS,
+    DEFAULT_VALIDATE_READINGS,
+    OUTLIER_WINDOW,
+    OUTLIER_THRESHOLD,
+    OUTLIER_MIN_SPREAD,
+)
+
+# Home Assistant is only imported inside the setup functions, so the
+# package can also be run as a command line poller (see __main__.py)
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.SENSOR, Platform.NUMBER, Platform.SWITCH]
+PLATFORMS = ["sensor", "number", "switch"]
+
+# Integration modules in dependency order, leaves first, so each import
+# time measured in profiling mode is mostly the module itself
+PROFILED_MODULES = [
+    "const", "parser", "cache", "breaker", "scheduler", "metrics", "series", "validation",
+    "history", "client", "backend", "coordinator", "entity", "sensor", "number", "switch",
+]
+
+def _profile_imports() -> dict[str, float]:
+    """Import each integration module and return the milliseconds each took.
+
+    Modules already imported by Home Assistant report close to zero.
+    """
+    import importlib
+    
+    timings = {}
+    for module in PROFILED_MODULES:
+        started = time.perf_counter()
+        importlib.import_module(f"{__name__}.{module}")
+        timings[module] = round((time.perf_counter() - started) * 1000, 2)
+    return timings
 
-async def async_setup(hass: HomeAssistant, config: dict):
+async def async_setup(hass: "HomeAssistant", config: dict):
     """Set up the Loggamera integration from YAML (deprecated)."""
     # YAML configuration is deprecated, use Config Flow instead
+    import voluptuous as vol
+    from homeassistant.core import ServiceCall
+    import homeassistant.helpers.config_validation as cv
+    
+    async def _async_import_statistics(call: ServiceCall) -> None:
+        """Backfill long-term statistics for a sensor."""
+        from .backfill import async_import_history
+        await async_import_history(
+            hass,
+            call.data["sensor_id"],
+            call.data.get("path"),
+            call.data.get("format"),
+            call.data.get("reject_outliers", False),
+            call.data.get("config_entry_id"),
+        )
+    
+    hass.services.async_register(
+        DOMAIN,
+        "import_statistics",
+        _async_import_statistics,
+        schema=vol.Schema({
+            vol.Required("sensor_id"): vol.Coerce(int),
+            vol.Optional("path"): cv.string,
+            vol.Optional("format"): vol.In(["csv", "jsonl"]),
+            vol.Optional("reject_outliers", default=False): cv.boolean,
+            vol.Optional("config_entry_id"): cv.string,
+        }),
+    )
+    
+    async def _async_reconfigure(call: ServiceCall) -> None:
+        """Change settings of a running entry without reloading it."""
+        from homeassistant.exceptions import HomeAssistantError
+        
+        runtime = hass.data.get(DOMAIN, {}).get(call.data["config_entry_id"])
+        if runtime is None:
+            raise HomeAssistantError(f"No loaded Loggamera entry {call.data['config_entry_id']}")
+        if "scan_interval" in call.data:
+            runtime.async_set_scan_interval(call.data["scan_interval"])
+        if "debug_mode" in call.data:
+            runtime.async_set_debug_mode(call.data["debug_mode"])
+        if "sensor_ids" in call.data:
+            await runtime.async_set_sensor_ids(call.data["sensor_ids"])
+    
+    hass.services.async_register(
+        DOMAIN,
+        "reconfigure",
+        _async_reconfigure,
+        schema=vol.Schema({
+            vol.Required("config_entry_id"): cv.string,
+            vol.Optional("scan_interval"): vol.All(
+                vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
+            ),
+            vol.Optional("sensor_ids"): vol.All(cv.ensure_list, vol.Length(min=1), [vol.Coerce(int)]),
+            vol.Optional("debug_mode"): cv.boolean,
+        }),
+    )
     return True
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
+async def async_migrate_entry(hass: "HomeAssistant", entry: "ConfigEntry") -> bool:
+    """Migrate entities of an entry created by an older version."""
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+    from .const import DEVICE_IDENTIFIER
+    
+    if entry.version > 3:
+        return False
+    
+    if entry.version == 1:
+        # Unique ids and the device were shared by all entries; scope them
+        # to the entry so several entries can exist side by side
+        prefix = f"{DOMAIN}_"
+        
+        def _scope_unique_id(entity: "er.RegistryEntry") -> dict | None:
+            if not entity.unique_id.startswith(prefix):
+                return None
+            return {"new_unique_id": f"{entry.entry_id}_{entity.unique_id[len(prefix):]}"}
+        
+        await er.async_migrate_entries(hass, entry.entry_id, _scope_unique_id)
+        
+        device_registry = dr.async_get(hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, DEVICE_IDENTIFIER)})
+        if device is not None:
+            device_registry.async_update_device(
+                device.id, new_identifiers={(DOMAIN, f"{entry.entry_id}_{DEVICE_IDENTIFIER}")}
+            )
+        hass.config_entries.async_update_entry(entry, version=2)
+        _LOGGER.info(f"Migrated Loggamera entry {entry.entry_id} to version 2")
+    
+    if entry.version == 2:
+        # Page readings shared the id space of the temperature and derived
+        # sensors; move them to their own
+        from .sensor import DERIVED_KINDS
+        own_suffixes = {"temperature", *DERIVED_KINDS}
+        
+        def _namespace_reading(entity: "er.RegistryEntry") -> dict | None:
+            sensor_id, _, key = entity.unique_id.removeprefix(f"{entry.entry_id}_").partition("_")
+            if (
+                entity.domain != "sensor"
+                or not sensor_id.isdigit()
+                or key in own_suffixes
+                or key.startswith("reading_")
+            ):
+                return None
+            return {"new_unique_id": f"{entry.entry_id}_{sensor_id}_reading_{key}"}
+        
+        await er.async_migrate_entries(hass, entry.entry_id, _namespace_reading)
+        hass.config_entries.async_update_entry(entry, version=3)
+        _LOGGER.info(f"Migrated Loggamera entry {entry.entry_id} to version 3")
+    
+    return True
+
+async def async_setup_entry(hass: "HomeAssistant", entry: "ConfigEntry"):
     """Set up Loggamera from a config entry."""
     _LOGGER.info("Setting up Loggamera integration with config entry")
+    setup_started = time.perf_counter()
+    # Options set in the UI override settings stored with the entry
+    config_data = {**entry.data, **entry.options}
+    
+    profile = None
+    if config_data.get("profile_startup", DEFAULT_PROFILE_STARTUP):
+        # Import in a worker thread so the measurement does not block the loop
+        profile = {"import_ms": await hass.async_add_executor_job(_profile_imports), "setup_ms": {}}
+    
+    def _mark(step: str, started: float) -> None:
+        if profile is not None:
+            profile["setup_ms"][step] = round((time.perf_counter() - started) * 1000, 2)
     
     # Import dependencies only when needed to avoid blocking
-    import asyncio
-    import aiohttp
-    from homeassistant.helpers.aiohttp_client import async_get_clientsession
-    
-    # Test API connectivity before setting up platforms
-    session = async_get_clientsession(hass)
-    config_data = entry.data
-    selected_sensors = config_data.get("sensors", [22, 21])
-    
-    # Test at least one sensor to verify API connectivity
-    test_sensor_id = selected_sensors[0] if selected_sensors else 22
-    
-    try:
-        await _test_api_connectivity(session, test_sensor_id)
-        _LOGGER.debug(f"API connectivity test successful for sensor {test_sensor_id}")
-    except (asyncio.TimeoutError, aiohttp.ClientError) as err:
-        _LOGGER.warning(f"Cannot connect to Loggamera API: {err}")
-        raise ConfigEntryNotReady(f"Cannot connect to Loggamera API: {err}") from err
-    except Exception as err:
-        _LOGGER.error(f"Unexpected error testing Loggamera API: {err}")
-        raise ConfigEntryNotReady(f"Unexpected error: {err}") from err
-    
-    # Store config data for platforms to access
+    from datetime import timedelta
+    from homeassistant.exceptions import ConfigEntryNotReady
+    from .client import async_get_client
+    from .coordinator import LoggameraDataCoordinator
+    from .history import LoggameraHistory
+    from .runtime import LoggameraRuntimeData
+    _mark("imports", setup_started)
+    
+    # Load last known readings from disk
+    step_started = time.perf_counter()
+    history = LoggameraHistory(hass, entry.entry_id)
+    await history.async_load()
+    _mark("history", step_started)
+    
+    coordinator = LoggameraDataCoordinator(
+        hass,
+        async_get_client(hass),
+        config_data.get("sensors", [22, 21]),
+        timedelta(seconds=config_data.get("scan_interval", DEFAULT_SCAN_INTERVAL)),
+        max_concurrent=config_data.get("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS),
+        request_timeout=config_data.get("request_timeout", DEFAULT_REQUEST_TIMEOUT),
+        parse_in_executor=config_data.get("parse_in_executor", DEFAULT_PARSE_IN_EXECUTOR),
+        adaptive_polling=config_data.get("adaptive_polling", DEFAULT_ADAPTIVE_POLLING),
+        extract_all_values=config_data.get("extract_all_values", DEFAULT_EXTRACT_ALL_VALUES),
+        collect_metrics=config_data.get("collect_metrics", DEFAULT_COLLECT_METRICS),
+        portal_url=config_data.get("portal_url"),
+        derived_sensors=config_data.get("derived_sensors", DEFAULT_DERIVED_SENSORS),
+        validate_readings=config_data.get("validate_readings", DEFAULT_VALIDATE_READINGS),
+        outlier_limits=(
+            config_data.get("outlier_window", OUTLIER_WINDOW),
+            config_data.get("outlier_threshold", OUTLIER_THRESHOLD),
+            config_data.get("outlier_min_spread", OUTLIER_MIN_SPREAD),
+        ),
+        history=history,
+        entry_id=entry.entry_id,
+    )
+    
+    if coordinator.restore_from_history():
+        # Entities start from the stored readings while fresh data loads
+        _LOGGER.info("Restored last known readings, fetching fresh data in background")
+        hass.async_create_task(coordinator.async_refresh())
+    else:
+        # The first fetch doubles as the connectivity check, so each page
+        # is only downloaded once during setup
+        fetch_started = time.perf_counter()
+        try:
+            await coordinator.async_config_entry_first_refresh()
+            _mark("first_refresh", fetch_started)
+            _LOGGER.debug(f"Initial data fetch took {(time.perf_counter() - fetch_started) * 1000:.0f} ms")
+            if coordinator.status == "Error":
+                _LOGGER.warning(f"Cannot connect to Loggamera API: {coordinator.last_error}")
+                raise ConfigEntryNotReady(f"Cannot connect to Loggamera API: {coordinator.last_error}")
+        except ConfigEntryNotReady:
+            # The next attempt loads the history again
+            await history.async_unload()
+            raise
+    
+    # The entry's device comes first, so each id's device can link to it
+    from homeassistant.helpers import device_registry as dr
+    from .entity import hub_device_info
+    dr.async_get(hass).async_get_or_create(config_entry_id=entry.entry_id, **hub_device_info(entry.entry_id))
+    
+    # Each entry keeps its own coordinator and settings for platforms to access
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    hass.data[DOMAIN][entry.entry_id] = LoggameraRuntimeData(hass, entry, coordinator)
+    entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
     
     # Load platforms asynchronously to avoid blocking
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if profile is None:
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    else:
+        # One at a time so each platform's setup can be timed
+        for platform in PLATFORMS:
+            step_started = time.perf_counter()
+            await hass.config_entries.async_forward_entry_setups(entry, [platform])
+            _mark(f"platform_{platform}", step_started)
+    
+    coordinator.setup_seconds = time.perf_counter() - setup_started
+    _LOGGER.info(f"Loggamera setup finished in {coordinator.setup_seconds * 1000:.0f} ms")
+    if profile is not None:
+        coordinator.startup_profile = profile
+        _LOGGER.info(f"Loggamera startup profile: {profile}")
     return True
 
-async def _test_api_connectivity(session, sensor_id):
-    """Test connectivity to Loggamera API."""
-    url = "https://portal.loggamera.se/PublicViews/OverviewInside"
-    data = {"id": sensor_id}
-    
-    async with session.post(url, data=data, timeout=10) as response:
-        if response.status != 200:
-            import aiohttp
-            raise aiohttp.ClientError(f"HTTP {response.status}")
-        
-        html = await response.text()
-        if len(html) < 100:  # Basic sanity check
-            import aiohttp
-            raise aiohttp.ClientError("Received empty or very short response")
+async def _async_entry_updated(hass: "HomeAssistant", entry: "ConfigEntry") -> None:
+    """Reload the entry when its options change.
+    
+    Settings changed at runtime are saved to the entry data and already
+    applied, so those updates do not reload it.
+    """
+    runtime = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if runtime is not None and entry.options != runtime.options:
+        await hass.config_entries.async_reload(entry.entry_id)
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
+async def async_remove_entry(hass: "HomeAssistant", entry: "ConfigEntry"):
+    """Remove stored data when a config entry is deleted."""
+    from .history import LoggameraHistory
+    await LoggameraHistory(hass, entry.entry_id).async_remove()
+
+async def async_unload_entry(hass: "HomeAssistant", entry: "ConfigEntry"):
     """Unload a config entry."""
     # Unload platforms asynchronously
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        runtime = hass.data[DOMAIN].pop(entry.entry_id)
+        if runtime.coordinator.history is not None:
+            await runtime.coordinator.history.async_unload()
+        
+        # Close pooled connections once the last entry is gone
+        if not any(
+            other.entry_id in hass.data[DOMAIN]
+            for other in hass.config_entries.async_entries(DOMAIN)
+        ):
+            from .client import async_close_client
+            await async_close_client(hass)
     
     return unload_ok 
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""Poll Loggamera ids from the command line, without Home Assistant.
+
+Run from the custom_components directory:
+
+    python -m loggamera poll --ids 21,22 --concurrency 8 --format jsonl
+
+Results are written as each fetch finishes. With --bench a throughput
+summary and latency histogram are printed to stderr afterwards.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import re
+import sys
+import time
+
+import aiohttp
+
+from .client import LoggameraClient, async_fetch_temperature, create_session
+from .const import DEFAULT_MAX_CONCURRENT_REQUESTS, DEFAULT_REQUEST_TIMEOUT, PORTAL_URL, RATE_LIMIT, RATE_BURST
+from .metrics import RollingWindow
+from .ratelimit import TokenBucket
+
+# Upper bounds in milliseconds of the --bench histogram buckets
+HISTOGRAM_BUCKETS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf"))
+HISTOGRAM_WIDTH = 40
+
+
+def parse_ids(values: list[str]) -> list[int]:
+    """Parse ids separated by commas or whitespace, with a-b ranges."""
+    sensor_ids = []
+    for value in values:
+        for part in re.split(r"[\s,;]+", value.strip()):
+            if not part:
+                continue
+            first, _, last = part.partition("-")
+            if last:
+                sensor_ids.extend(range(int(first), int(last) + 1))
+            else:
+                sensor_ids.append(int(part))
+    return list(dict.fromkeys(sensor_ids))
+
+
+async def _poll_one(client: LoggameraClient, semaphore: asyncio.Semaphore, sensor_id: int, timeout: float) -> dict:
+    """Fetch one id and return a result row, never raising."""
+    async with semaphore:
+        # Time only the request itself, not the wait for the rate limiter
+        waited = await client.limiter.acquire()
+        started = time.perf_counter()
+        temperature = error = None
+        try:
+            temperature = await async_fetch_temperature(client, sensor_id, timeout, acquired=True)
+            if temperature is None:
+                error = "No valid temperature found in response"
+        except asyncio.TimeoutError:
+            error = "Timeout while fetching data"
+        except aiohttp.ClientError as err:
+            error = f"Network error: {err}"
+        return {
+            "id": sensor_id,
+            "temperature": temperature,
+            "error": error,
+            "ms": round((time.perf_counter() - started) * 1000, 1),
+            "wait_ms": round(waited * 1000, 1),
+            "time": round(time.time(), 3),
+        }
+
+
+class _Writer:
+    """Write result rows to stdout in the chosen format, flushing each one."""
+
+    FIELDS = ("id", "temperature", "error", "ms", "wait_ms", "time")
+
+    def __init__(self, fmt: str):
+        """Initialize writer."""
+        self.fmt = fmt
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(sys.stdout, fieldnames=self.FIELDS)
+            self._csv.writeheader()
+
+    def write(self, row: dict) -> None:
+        """Write one row."""
+        if self.fmt == "jsonl":
+            sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+        elif self._csv is not None:
+            self._csv.writerow(row)
+        elif row["error"]:
+            sys.stdout.write(f"{row['id']}\tfel\t{row['error']}\n")
+        else:
+            sys.stdout.write(f"{row['id']}\t{row['temperature']}°C\t{row['ms']} ms\n")
+        sys.stdout.flush()
+
+
+def _print_bench(rows: list[dict], elapsed: float, limiter: TokenBucket) -> None:
+    """Print throughput, latency percentiles and a histogram to stderr."""
+    latencies = RollingWindow(max(1, len(rows)))
+    for row in rows:
+        latencies.add(row["ms"])
+    summary = latencies.summary()
+    failed = sum(1 for row in rows if row["error"])
+
+    out = sys.stderr
+    out.write(
+        f"{len(rows)} ids in {elapsed:.2f} s ({len(rows) / elapsed if elapsed else 0:.1f} ids/s), "
+        f"{failed} failed\n"
+        f"latency p50 {summary['p50']} ms, p95 {summary['p95']} ms, p99 {summary['p99']} ms\n"
+    )
+    limits = limiter.as_dict()
+    if limits["rate_per_second"] is not None:
+        out.write(
+            f"rate limit {limits['rate_per_second']}/s, {limits['queued']} queued, "
+            f"average wait {limits['average_wait_ms']} ms, max wait {limits['max_wait_ms']} ms\n"
+        )
+
+    counts = [0] * len(HISTOGRAM_BUCKETS)
+    for row in rows:
+        counts[next(i for i, bound in enumerate(HISTOGRAM_BUCKETS) if row["ms"] <= bound)] += 1
+    peak = max(counts) or 1
+    lower = 0
+    for bound, count in zip(HISTOGRAM_BUCKETS, counts):
+        label = f"{lower}-{bound:g} ms" if bound != float("inf") else f">{lower} ms"
+        out.write(f"{label:>14} {count:6d} {'#' * round(HISTOGRAM_WIDTH * count / peak)}\n")
+        lower = f"{bound:g}"
+
+
+async def async_poll(sensor_ids: list[int], concurrency: int, timeout: float, fmt: str, url: str, bench: bool, rate: float | None = None, burst: int = RATE_BURST) -> int:
+    """Poll all ids, writing results as they arrive. Return the number of failures.
+
+    Requests are only rate limited when ``rate`` is given.
+    """
+    limiter = TokenBucket(rate, burst)
+    client = LoggameraClient(create_session(), url=url, timeout=timeout, limiter=limiter)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    writer = _Writer(fmt)
+    rows = []
+    started = time.perf_counter()
+    try:
+        for completed in asyncio.as_completed(
+            [_poll_one(client, semaphore, sensor_id, timeout) for sensor_id in sensor_ids]
+        ):
+            row = await completed
+            writer.write(row)
+            rows.append(row)
+    finally:
+        await client.close()
+
+    if bench:
+        _print_bench(rows, time.perf_counter() - started, limiter)
+    return sum(1 for row in rows if row["error"])
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line interface."""
+    parser = argparse.ArgumentParser(prog="python -m loggamera", description="Poll Loggamera sensor pages.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    poll = commands.add_parser("poll", help="Fetch the current temperature of one or more ids.")
+    poll.add_argument("--ids", nargs="*", default=[], help="Ids, comma separated, ranges as 100-120.")
+    poll.add_argument("--ids-file", help="File with ids, or - for stdin.")
+    poll.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENT_REQUESTS, help="Parallel requests.")
+    poll.add_argument("--timeout", type=float, default=DEFAULT_REQUEST_TIMEOUT, help="Seconds per request.")
+    poll.add_argument("--format", choices=("jsonl", "csv", "text"), default="text", help="Output format.")
+    poll.add_argument("--url", default=PORTAL_URL, help="OverviewInside address to poll.")
+    poll.add_argument("--rate", type=float, help=f"Sustained requests per second, unlimited if not given (Home Assistant uses {RATE_LIMIT:g}).")
+    poll.add_argument("--burst", type=int, default=RATE_BURST, help="Requests sent at once before limiting.")
+    poll.add_argument("--bench", action="store_true", help="Print throughput and a latency histogram to stderr.")
+    args = parser.parse_args(argv)
+
+    values = list(args.ids)
+    if args.ids_file:
+        if args.ids_file == "-":
+            values.append(sys.stdin.read())
+        else:
+            with open(args.ids_file, encoding="utf-8") as handle:
+                values.append(handle.read())
+    try:
+        sensor_ids = parse_ids(values)
+    except ValueError:
+        parser.error("ids must be integers or ranges such as 100-120")
+    if not sensor_ids:
+        parser.error("no ids given, use --ids or --ids-file")
+
+    if (args.rate is not None and args.rate <= 0) or args.burst < 1:
+        parser.error("--rate must be positive and --burst at least 1")
+
+    failed = asyncio.run(async_poll(
+        sensor_ids, args.concurrency, args.timeout, args.format, args.url, args.bench, args.rate, args.burst
+    ))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
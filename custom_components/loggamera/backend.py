@@ -0,0 +1,230 @@
+"""Data source backends for Loggamera integration."""
+
+import abc
+import asyncio
+import codecs
+import time
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .client import ResponseTooLargeError, iter_capped
+from .metrics import PHASE_RATE_LIMIT, PHASE_CONNECT, PHASE_TRANSFER, PHASE_PARSE, RESPONSE_BYTES
+from .ratelimit import PRIORITY_POLL
+
+if TYPE_CHECKING:
+    from .coordinator import LoggameraDataCoordinator
+    # The parser is only imported once the first page is fetched
+    from .parser import TemperatureExtractor
+
+
+class LoggameraBackend(abc.ABC):
+    """A way of reading sensor temperatures from the Loggamera portal.
+
+    Backends only fetch and decode; the coordinator applies the
+    concurrency limit, circuit breakers and single-flight sharing through
+    ``coordinator.run_limited``. Other page values found along the way go
+    into ``coordinator.page_readings``. A backend that reports ``batched``
+    also provides ``async_fetch_batch``, returning a temperature or
+    exception for each sensor in order.
+    """
+
+    name = "base"
+
+    def __init__(self, coordinator: "LoggameraDataCoordinator"):
+        """Initialize backend."""
+        self.coordinator = coordinator
+
+    @property
+    def batched(self) -> bool:
+        """Return True if a refresh should go through fetch_batch."""
+        return False
+
+    @abc.abstractmethod
+    async def async_fetch(self, sensor_id: int, priority: int = PRIORITY_POLL) -> float:
+        """Return the temperature for one sensor, raising UpdateFailed on errors."""
+
+
+class HtmlBackend(LoggameraBackend):
+    """Scrape the display-value from the PublicViews/OverviewInside page.
+
+    Pages are parsed as they stream in, or all downloaded first and parsed
+    in one executor job when ``parse_in_executor`` is set.
+    """
+
+    name = "html"
+
+    @property
+    def batched(self) -> bool:
+        """Return True if pages are parsed in the executor."""
+        return self.coordinator.parse_in_executor
+
+    async def async_fetch_batch(self, sensor_ids: list) -> list:
+        """Download all pages, then parse them in a single executor job."""
+        coordinator = self.coordinator
+        pages = await asyncio.gather(
+            *(
+                coordinator.run_limited("page", sensor_id, lambda sensor_id=sensor_id: self._fetch_page(sensor_id))
+                for sensor_id in sensor_ids
+            ),
+            return_exceptions=True,
+        )
+
+        # Cache hits come back as floats and need no parsing
+        pending = [i for i, page in enumerate(pages) if isinstance(page, tuple)]
+        parsed = []
+        if pending:
+            from .parser import parse_pages
+            started = time.perf_counter()
+            parsed = await coordinator.hass.async_add_executor_job(
+                parse_pages, [pages[i][:2] for i in pending], coordinator.extract_all_values
+            )
+            if coordinator.metrics is not None:
+                per_page = (time.perf_counter() - started) * 1000 / len(pending)
+                for i in pending:
+                    coordinator.metrics.record(sensor_ids[i], PHASE_PARSE, per_page)
+
+        results = list(pages)
+        for i, (temperature, readings) in zip(pending, parsed):
+            sensor_id = sensor_ids[i]
+            body, _, headers = pages[i]
+            if coordinator.extract_all_values:
+                coordinator.page_readings[sensor_id] = readings
+            if temperature is None:
+                coordinator.cache.invalidate(sensor_id)
+                results[i] = UpdateFailed("No valid temperature found in response")
+            else:
+                coordinator.cache.store(sensor_id, temperature, body, headers)
+                results[i] = temperature
+        return results
+
+    async def _fetch_page(self, location_id: int):
+        """Download the page for a specific location.
+
+        Returns the cached temperature if the page is unchanged, otherwise
+        a (body, charset, headers) tuple for parsing.
+        """
+        coordinator = self.coordinator
+        headers = coordinator.cache.conditional_headers(location_id)
+        self._record_wait(location_id, await coordinator.client.limiter.acquire(PRIORITY_POLL))
+        started = time.perf_counter()
+
+        try:
+            async with coordinator.client.request(location_id, headers=headers, timeout=coordinator.request_timeout, url=coordinator.portal_url, acquired=True) as response:
+                connected = time.perf_counter()
+                if response.status == 304:
+                    return self._not_modified(location_id)
+                response.raise_for_status()
+                body = b"".join([chunk async for chunk in iter_capped(response)])
+                if coordinator.metrics is not None:
+                    self._record_transfer(location_id, started, connected, len(body))
+
+                temperature = coordinator.cache.lookup(location_id, body)
+                if temperature is not None:
+                    return temperature
+                return body, response.charset, response.headers
+        except asyncio.TimeoutError:
+            raise UpdateFailed("Timeout while fetching data")
+        except ResponseTooLargeError as err:
+            raise UpdateFailed(str(err))
+        except aiohttp.ClientError as err:
+            raise UpdateFailed(f"Network error: {err}")
+
+    async def async_fetch(self, location_id: int, priority: int = PRIORITY_POLL) -> float:
+        """Fetch temperature for a specific location."""
+        coordinator = self.coordinator
+        headers = coordinator.cache.conditional_headers(location_id)
+        cached = coordinator.cache.get(location_id)
+        self._record_wait(location_id, await coordinator.client.limiter.acquire(priority))
+        started = time.perf_counter()
+        connected = None
+        parse_seconds = 0.0
+        consumed = bytearray()
+
+        try:
+            async with coordinator.client.request(location_id, headers=headers, timeout=coordinator.request_timeout, url=coordinator.portal_url, acquired=True) as response:
+                connected = time.perf_counter()
+                if response.status == 304:
+                    return self._not_modified(location_id)
+                response.raise_for_status()
+
+                # Parse the page as it streams in and stop at the first valid reading.
+                # If the page starts with the same content as last time, the
+                # cached value is reused without parsing anything.
+                from .parser import TemperatureExtractor
+                extractor = TemperatureExtractor(coordinator.extract_all_values)
+                decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+                parsed = 0
+                async for chunk in iter_capped(response):
+                    consumed += chunk
+                    if cached is not None:
+                        if len(consumed) < cached.length:
+                            continue
+                        temperature = coordinator.cache.lookup(location_id, bytes(consumed))
+                        if temperature is not None:
+                            return temperature
+                        cached = None
+
+                    parse_seconds += self._feed_extractor(extractor, decoder, bytes(consumed[parsed:]))
+                    parsed = len(consumed)
+                    if extractor.done:
+                        return self._parsed(location_id, extractor, bytes(consumed), response.headers)
+
+                parse_seconds += self._feed_extractor(extractor, decoder, bytes(consumed[parsed:]), final=True)
+                if extractor.temperature is not None:
+                    return self._parsed(location_id, extractor, bytes(consumed), response.headers)
+
+                coordinator.cache.invalidate(location_id)
+                raise UpdateFailed("No valid temperature found in response")
+
+        except asyncio.TimeoutError:
+            raise UpdateFailed("Timeout while fetching data")
+        except ResponseTooLargeError as err:
+            raise UpdateFailed(str(err))
+        except aiohttp.ClientError as err:
+            raise UpdateFailed(f"Network error: {err}")
+        finally:
+            if coordinator.metrics is not None and connected is not None:
+                self._record_transfer(location_id, started, connected, len(consumed), parse_seconds)
+
+    def _record_wait(self, location_id: int, waited: float) -> None:
+        """Record how long a fetch waited for the rate limiter."""
+        if self.coordinator.metrics is not None:
+            self.coordinator.metrics.record(location_id, PHASE_RATE_LIMIT, waited * 1000)
+
+    def _record_transfer(self, location_id: int, started: float, connected: float, size: int, parse_seconds: float = 0.0) -> None:
+        """Record connect, transfer and parse timings and the response size for a fetch."""
+        finished = time.perf_counter()
+        metrics = self.coordinator.metrics
+        metrics.record(location_id, PHASE_CONNECT, (connected - started) * 1000)
+        metrics.record(location_id, PHASE_TRANSFER, (finished - connected - parse_seconds) * 1000)
+        if parse_seconds:
+            metrics.record(location_id, PHASE_PARSE, parse_seconds * 1000)
+        metrics.record(location_id, RESPONSE_BYTES, size)
+
+    def _parsed(self, location_id: int, extractor: "TemperatureExtractor", prefix: bytes, headers) -> float:
+        """Cache a freshly parsed page and return its temperature."""
+        if self.coordinator.extract_all_values:
+            self.coordinator.page_readings[location_id] = extractor.readings
+        self.coordinator.cache.store(location_id, extractor.temperature, prefix, headers)
+        return extractor.temperature
+
+    def _feed_extractor(self, extractor: "TemperatureExtractor", decoder, data: bytes, final: bool = False) -> float:
+        """Feed raw bytes to the extractor and return how long the event loop was blocked."""
+        started = time.perf_counter()
+        extractor.feed(decoder.decode(data, final=final))
+        if final:
+            extractor.close()
+        elapsed = time.perf_counter() - started
+        self.coordinator.loop_blocked_seconds += elapsed
+        return elapsed
+
+    def _not_modified(self, location_id: int) -> float:
+        """Return the cached temperature for a 304 Not Modified response."""
+        temperature = self.coordinator.cache.not_modified(location_id)
+        if temperature is None:
+            raise UpdateFailed("Not modified response without a cached reading")
+        return temperature
+
@@ -0,0 +1,253 @@
+"""Backfill historical readings into Home Assistant long-term statistics."""
+
+import csv
+import json
+import logging
+import time
+from datetime import datetime, timezone
+
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, BACKFILL_READ_ROWS, BACKFILL_IMPORT_HOURS
+from .validation import ReadingValidator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+HOUR = 3600
+
+
+def _parse_timestamp(value) -> float:
+    """Return epoch seconds for an epoch number or ISO 8601 string."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+
+class _RowReader:
+    """Read (timestamp, temperature) rows from a CSV or JSON Lines dump in batches.
+
+    CSV files need a header with ``timestamp`` and ``temperature`` columns;
+    JSON Lines files need one object with the same keys per line. Rows
+    that cannot be parsed are counted and skipped.
+    """
+
+    def __init__(self, path: str, fmt: str):
+        """Open the dump file."""
+        self._handle = open(path, newline="", encoding="utf-8")
+        if fmt == "csv":
+            self._rows = csv.DictReader(self._handle)
+        else:
+            self._rows = (json.loads(line) for line in self._handle if line.strip())
+        self.invalid = 0
+
+    def read(self, count: int) -> list[tuple[float, float]]:
+        """Return up to count parsed rows, or an empty list at end of file."""
+        batch = []
+        for row in self._rows:
+            try:
+                batch.append((_parse_timestamp(row["timestamp"]), float(row["temperature"])))
+            except (KeyError, TypeError, ValueError):
+                self.invalid += 1
+            if len(batch) >= count:
+                break
+        return batch
+
+    def close(self) -> None:
+        """Close the dump file."""
+        self._handle.close()
+
+
+class HourlyAggregator:
+    """Fold time-ordered readings into hourly mean/min/max buckets."""
+
+    __slots__ = ("start", "total", "count", "minimum", "maximum")
+
+    def __init__(self):
+        """Initialize aggregator."""
+        self.start = None
+        self.total = 0.0
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, timestamp: float, value: float) -> dict | None:
+        """Add a reading; return the previous hour's statistic when it closes."""
+        hour = timestamp - timestamp % HOUR
+        finished = None
+        if self.start is not None and hour != self.start:
+            finished = self.flush()
+        if self.start is None:
+            self.start = hour
+            self.minimum = self.maximum = value
+        self.total += value
+        self.count += 1
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        return finished
+
+    def flush(self) -> dict | None:
+        """Return the open bucket as a statistic and reset."""
+        if self.start is None:
+            return None
+        statistic = {
+            "start": datetime.fromtimestamp(self.start, tz=timezone.utc),
+            "mean": round(self.total / self.count, 2),
+            "min": self.minimum,
+            "max": self.maximum,
+        }
+        self.__init__()
+        return statistic
+
+
+def _polling_runtime(hass: HomeAssistant, sensor_id: int, config_entry_id: str | None = None):
+    """Return the runtime data of the loaded entry that polls a sensor.
+
+    ``config_entry_id`` picks the entry when more than one polls the id.
+    """
+    runtimes = [
+        runtime
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if (config_entry_id is None or entry.entry_id == config_entry_id)
+        and (runtime := hass.data.get(DOMAIN, {}).get(entry.entry_id)) is not None
+        and sensor_id in runtime.coordinator.sensor_ids
+    ]
+    if not runtimes:
+        raise HomeAssistantError(f"No loaded Loggamera entry polls sensor {sensor_id}")
+    if len(runtimes) > 1:
+        raise HomeAssistantError(
+            f"Several Loggamera entries poll sensor {sensor_id}, choose one with config_entry_id"
+        )
+    return runtimes[0]
+
+
+def _temperature_entity_id(hass: HomeAssistant, entry_id: str, sensor_id: int) -> str:
+    """Return the entity id of a sensor's temperature entity in an entry."""
+    registry = er.async_get(hass)
+    entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{entry_id}_{sensor_id}_temperature")
+    if entity_id is None:
+        raise HomeAssistantError(f"No temperature entity for Loggamera sensor {sensor_id}")
+    return entity_id
+
+
+async def async_import_history(
+    hass: HomeAssistant,
+    sensor_id: int,
+    path: str | None = None,
+    fmt: str | None = None,
+    reject_outliers: bool = False,
+    config_entry_id: str | None = None,
+) -> int:
+    """Import readings into long-term statistics for a sensor's temperature entity.
+
+    Reads a CSV or JSON Lines dump from ``path`` in batches, or the
+    integration's stored reading history when no path is given. Rows must
+    be in time order. Progress is stored per entity so an interrupted
+    import resumes after the last imported hour. Returns the number of
+    hourly statistics imported. With ``reject_outliers`` each batch goes
+    through the same outlier filter as live readings first. The entity
+    belongs to the entry polling the sensor, or to ``config_entry_id``
+    when several entries poll it.
+    """
+    from homeassistant.components.recorder.statistics import async_import_statistics
+
+    runtime = _polling_runtime(hass, sensor_id, config_entry_id)
+    entity_id = _temperature_entity_id(hass, runtime.entry.entry_id, sensor_id)
+    metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": None,
+        "source": "recorder",
+        "statistic_id": entity_id,
+        "unit_of_measurement": UnitOfTemperature.CELSIUS,
+    }
+
+    progress_store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.backfill")
+    progress = await progress_store.async_load() or {}
+    resume_after = progress.get(entity_id)
+
+    if path is None:
+        history = runtime.coordinator.history
+        if history is None:
+            raise HomeAssistantError("No stored reading history available")
+        stored = [tuple(reading) for reading in history.readings(sensor_id)]
+
+        async def read_batch():
+            batch = stored[:BACKFILL_READ_ROWS]
+            del stored[:BACKFILL_READ_ROWS]
+            return batch
+
+        reader = None
+    else:
+        fmt = fmt or ("csv" if path.lower().endswith(".csv") else "jsonl")
+        try:
+            reader = await hass.async_add_executor_job(_RowReader, path, fmt)
+        except OSError as err:
+            raise HomeAssistantError(f"Cannot open {path}: {err}") from err
+
+        async def read_batch():
+            return await hass.async_add_executor_job(reader.read, BACKFILL_READ_ROWS)
+
+    started = time.perf_counter()
+    validator = ReadingValidator() if reject_outliers else None
+    aggregator = HourlyAggregator()
+    pending = []
+    rows = skipped = imported = 0
+
+    async def import_pending():
+        nonlocal imported
+        if not pending:
+            return
+        async_import_statistics(hass, metadata, list(pending))
+        imported += len(pending)
+        progress[entity_id] = pending[-1]["start"].timestamp()
+        await progress_store.async_save(progress)
+        pending.clear()
+
+    try:
+        while batch := await read_batch():
+            if validator is not None:
+                # Rejected rows still count as read
+                accepted = validator.filter(value for _, value in batch)
+                rows += len(batch) - sum(accepted)
+                batch = [row for row, keep in zip(batch, accepted) if keep]
+            for timestamp, value in batch:
+                rows += 1
+                if resume_after is not None and timestamp < resume_after + HOUR:
+                    skipped += 1
+                    continue
+                if aggregator.start is not None and timestamp < aggregator.start:
+                    # Out of order, the hour has already been aggregated
+                    skipped += 1
+                    continue
+                statistic = aggregator.add(timestamp, value)
+                if statistic is not None:
+                    pending.append(statistic)
+            if len(pending) >= BACKFILL_IMPORT_HOURS:
+                await import_pending()
+
+        # The last hour is only imported once it is complete
+        statistic = aggregator.flush()
+        if statistic is not None and statistic["start"].timestamp() + HOUR <= time.time():
+            pending.append(statistic)
+        await import_pending()
+    finally:
+        if reader is not None:
+            await hass.async_add_executor_job(reader.close)
+
+    elapsed = time.perf_counter() - started
+    _LOGGER.info(
+        f"Imported {imported} hourly statistics for {entity_id} from {rows} rows "
+        f"({rows / elapsed if elapsed else 0:.0f} rows/s, {skipped} skipped"
+        f"{f', {reader.invalid} invalid' if reader is not None and reader.invalid else ''}"
+        f"{f', {validator.rejected} outliers' if validator is not None and validator.rejected else ''})"
+    )
+    return imported
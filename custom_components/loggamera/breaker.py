@@ -0,0 +1,64 @@
+"""Per-sensor circuit breaker for Loggamera requests."""
+
+import random
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import BREAKER_FAILURE_THRESHOLD, BREAKER_BASE_BACKOFF, BREAKER_MAX_BACKOFF
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(UpdateFailed):
+    """Raised instead of sending a request while a sensor's circuit is open."""
+
+
+class CircuitBreaker:
+    """Stop polling a failing sensor for a jittered, exponentially growing time.
+
+    After BREAKER_FAILURE_THRESHOLD consecutive failures the circuit opens
+    and requests fail fast. Once the backoff has passed a single trial
+    request is let through (half-open): success closes the circuit, failure
+    opens it again with a longer backoff.
+    """
+
+    __slots__ = ("state", "failures", "open_count", "retry_at")
+
+    def __init__(self):
+        """Initialize breaker."""
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.open_count = 0
+        self.retry_at = 0.0
+
+    def allow(self, now: float) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state == STATE_CLOSED:
+            return True
+        if self.state == STATE_OPEN and now >= self.retry_at:
+            self.state = STATE_HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.open_count = 0
+
+    def cancel_trial(self) -> None:
+        """Allow a new trial request if the current one was cancelled."""
+        if self.state == STATE_HALF_OPEN:
+            self.state = STATE_OPEN
+
+    def record_failure(self, now: float) -> None:
+        """Count a failed request and open the circuit if needed."""
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN or self.failures >= BREAKER_FAILURE_THRESHOLD:
+            self.open_count += 1
+            backoff = min(BREAKER_MAX_BACKOFF, BREAKER_BASE_BACKOFF * 2 ** (self.open_count - 1))
+            # Jitter spreads retries so sensors do not all hit the portal at once
+            self.retry_at = now + random.uniform(backoff / 2, backoff)
+            self.state = STATE_OPEN
@@ -0,0 +1,97 @@
+"""Per-sensor response cache for Loggamera OverviewInside pages."""
+
+import hashlib
+
+
+class CachedReading:
+    """Last parsed reading for a sensor and how to recognise its page."""
+
+    __slots__ = ("temperature", "digest", "length", "etag", "last_modified")
+
+    def __init__(self, temperature: float, digest: str, length: int, etag: str | None = None, last_modified: str | None = None):
+        """Initialize cached reading."""
+        self.temperature = temperature
+        self.digest = digest      # Hash of the first `length` bytes of the page
+        self.length = length
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+def page_digest(body: bytes) -> str:
+    """Return the content hash used to recognise an unchanged page."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class LoggameraResponseCache:
+    """Reuse the last parsed value when a sensor's page has not changed.
+
+    Only the part of the page up to the reading is hashed, so an unchanged
+    page can be recognised without downloading or parsing the rest of it.
+    """
+
+    def __init__(self):
+        """Initialize cache."""
+        self._entries: dict[int, CachedReading] = {}
+        # Sensors with a page parsed since take_new_sample last asked
+        self._new_samples: set[int] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, sensor_id: int) -> CachedReading | None:
+        """Return the cached reading for a sensor, if any."""
+        return self._entries.get(sensor_id)
+
+    def conditional_headers(self, sensor_id: int) -> dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for a sensor."""
+        entry = self._entries.get(sensor_id)
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def lookup(self, sensor_id: int, prefix: bytes) -> float | None:
+        """Return the cached value if the page starts with the cached content."""
+        entry = self._entries.get(sensor_id)
+        if entry is None or len(prefix) < entry.length:
+            return None
+        if page_digest(prefix[:entry.length]) != entry.digest:
+            return None
+        self.hits += 1
+        return entry.temperature
+
+    def not_modified(self, sensor_id: int) -> float | None:
+        """Record a 304 response and return the cached value."""
+        entry = self._entries.get(sensor_id)
+        if entry is None:
+            return None
+        self.hits += 1
+        return entry.temperature
+
+    def store(self, sensor_id: int, temperature: float, prefix: bytes, headers=None) -> None:
+        """Remember a freshly parsed reading and the page prefix it came from."""
+        self.misses += 1
+        self._new_samples.add(sensor_id)
+        headers = headers or {}
+        self._entries[sensor_id] = CachedReading(
+            temperature,
+            page_digest(prefix),
+            len(prefix),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+
+    def take_new_sample(self, sensor_id: int) -> bool:
+        """Return True once for each page parsed for a sensor rather than recognised."""
+        if sensor_id in self._new_samples:
+            self._new_samples.discard(sensor_id)
+            return True
+        return False
+
+    def invalidate(self, sensor_id: int) -> None:
+        """Forget the cached reading for a sensor."""
+        self._entries.pop(sensor_id, None)
+        self._new_samples.discard(sensor_id)
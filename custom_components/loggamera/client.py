@@ -0,0 +1,196 @@
+"""HTTP client for the Loggamera portal.
+
+Independent of Home Assistant, so the command line poller can use it too;
+only the shared-client helpers at the end need a running instance.
+"""
+
+import asyncio
+import codecs
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from .const import (
+    DOMAIN,
+    PORTAL_URL,
+    DEFAULT_REQUEST_TIMEOUT,
+    READ_CHUNK_SIZE,
+    MAX_RESPONSE_BYTES,
+    CONNECTION_LIMIT_PER_HOST,
+    KEEPALIVE_TIMEOUT,
+    DNS_CACHE_TTL,
+    SINGLE_FLIGHT_FRESHNESS,
+)
+from .ratelimit import TokenBucket, PRIORITY_POLL
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ResponseTooLargeError(aiohttp.ClientPayloadError):
+    """Raised when a page is larger than the response size cap."""
+
+
+async def iter_capped(response: aiohttp.ClientResponse, limit: int = MAX_RESPONSE_BYTES):
+    """Yield a response body in chunks, raising once more than limit bytes arrive.
+
+    A declared Content-Length over the limit fails before anything is read.
+    Stopping early and leaving the response context releases the
+    connection without reading the rest of the page.
+    """
+    if response.content_length is not None and response.content_length > limit:
+        raise ResponseTooLargeError(f"Response of {response.content_length} bytes exceeds {limit} byte limit")
+    received = 0
+    async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+        received += len(chunk)
+        if received > limit:
+            raise ResponseTooLargeError(f"Response exceeds {limit} byte limit")
+        yield chunk
+
+
+class InFlightRegistry:
+    """Coalesce concurrent fetches of the same key into a single request.
+
+    The first caller for a key starts the fetch as its own task and every
+    caller, the first one included, awaits it through ``asyncio.shield``.
+    A caller that is cancelled only stops waiting; the fetch runs on for
+    the others. A successful result is reused for ``freshness`` seconds.
+    """
+
+    def __init__(self, freshness: float = SINGLE_FLIGHT_FRESHNESS):
+        """Initialize registry."""
+        self.freshness = freshness
+        self.started = 0
+        self.shared = 0
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._results: dict[Hashable, tuple[float, object]] = {}
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable]):
+        """Return the result for key, fetching it only if nobody else is."""
+        fresh = self._results.get(key)
+        if fresh is not None and time.monotonic() - fresh[0] <= self.freshness:
+            self.shared += 1
+            return fresh[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda done: self._finished(key, done))
+            self.started += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished fetch and keep its result if it succeeded."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Reading the exception also stops an unawaited failure being logged
+        if not task.cancelled() and task.exception() is None:
+            self._results[key] = (time.monotonic(), task.result())
+
+
+class LoggameraClient:
+    """Pooled client for OverviewInside requests.
+
+    Keeps its own connector so connections to portal.loggamera.se are
+    kept alive and reused between polls, with a per-host connection limit
+    and cached DNS lookups. Every request first takes a token from the
+    client's rate limiter, which is shared by all config entries.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, url: str = PORTAL_URL, timeout: float = DEFAULT_REQUEST_TIMEOUT, limiter: TokenBucket | None = None):
+        """Initialize client."""
+        self._session = session
+        self.url = url
+        self.timeout = timeout
+        self.inflight = InFlightRegistry()
+        self.limiter = limiter or TokenBucket()
+
+    @asynccontextmanager
+    async def request(self, sensor_id: int, headers: dict | None = None, timeout: float | None = None, url: str | None = None, priority: int = PRIORITY_POLL, acquired: bool = False):
+        """Return a response context manager for a sensor's OverviewInside page.
+
+        ``url`` overrides the portal address, e.g. to poll a local stand-in.
+        Waiting for the rate limiter does not count towards the timeout.
+        Callers that time the request take the token themselves first and
+        pass ``acquired``, so the wait is not counted as network time.
+        """
+        if not acquired:
+            await self.limiter.acquire(priority)
+        async with self._session.post(
+            url or self.url,
+            data={"id": sensor_id},
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout or self.timeout),
+        ) as response:
+            yield response
+
+    async def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        await self._session.close()
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a session with a connector tuned for polling one host."""
+    connector = aiohttp.TCPConnector(
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def async_fetch_temperature(client: LoggameraClient, sensor_id: int, timeout: float | None = None, priority: int = PRIORITY_POLL, acquired: bool = False) -> float | None:
+    """Stream a sensor's page and return its first valid temperature, or None.
+
+    Reading stops as soon as the temperature is found. Network errors and
+    pages over the size cap are raised as aiohttp.ClientError, timeouts as
+    asyncio.TimeoutError.
+    """
+    from .parser import TemperatureExtractor
+
+    async with client.request(sensor_id, timeout=timeout, priority=priority, acquired=acquired) as response:
+        response.raise_for_status()
+        extractor = TemperatureExtractor()
+        decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+        async for chunk in iter_capped(response):
+            extractor.feed(decoder.decode(chunk))
+            if extractor.done:
+                return extractor.temperature
+        extractor.feed(decoder.decode(b"", final=True))
+        extractor.close()
+        return extractor.temperature
+
+
+def async_get_client(hass: "HomeAssistant") -> LoggameraClient:
+    """Return the shared Loggamera client, creating it on first use."""
+    from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    client = domain_data.get("client")
+    if client is not None:
+        return client
+
+    client = domain_data["client"] = LoggameraClient(create_session())
+
+    async def _async_close(event) -> None:
+        await client.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    _LOGGER.debug("Created pooled Loggamera client")
+    return client
+
+
+async def async_close_client(hass: "HomeAssistant") -> None:
+    """Close and forget the shared client."""
+    client = hass.data.get(DOMAIN, {}).pop("client", None)
+    if client is not None:
+        await client.close()
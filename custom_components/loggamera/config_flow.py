@@ -1,12 +1,58 @@
 """Config flow for Loggamera integration."""
+import re
+
 from homeassistant import config_entries
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_PARSE_IN_EXECUTOR,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_EXTRACT_ALL_VALUES,
+    DEFAULT_COLLECT_METRICS,
+    DEFAULT_PROFILE_STARTUP,
+    DEFAULT_RECORD_VOLATILE_ATTRIBUTES,
+    DEFAULT_DERIVED_SENSORS,
+    DEFAULT_VALIDATE_READINGS,
+    OUTLIER_WINDOW,
+    OUTLIER_THRESHOLD,
+    OUTLIER_MIN_SPREAD,
+)
+
+def parse_sensor_ids(text: str) -> list[int]:
+    """Parse a comma or whitespace separated list of Loggamera ids."""
+    return [int(part) for part in re.split(r"[\s,;]+", text.strip()) if part]
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+async def async_validate_sensor_ids(hass: HomeAssistant, sensor_ids: list[int]) -> list[int]:
+    """Fetch all ids concurrently and return those without a valid reading.
+    
+    Requests share the client's rate limiter with polling, queued behind
+    scheduled polls.
+    """
+    import asyncio
+    from .client import async_fetch_temperature, async_get_client
+    from .ratelimit import PRIORITY_INTERACTIVE
+    
+    client = async_get_client(hass)
+    semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_REQUESTS)
+    
+    async def _is_valid(sensor_id: int) -> bool:
+        async with semaphore:
+            try:
+                return await async_fetch_temperature(client, sensor_id, priority=PRIORITY_INTERACTIVE) is not None
+            except Exception:
+                return False
+    
+    results = await asyncio.gather(*(_is_valid(sensor_id) for sensor_id in sensor_ids))
+    return [sensor_id for sensor_id, valid in zip(sensor_ids, results) if not valid]
 
 class LoggameraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Loggamera."""
 
-    VERSION = 1
+    VERSION = 3
 
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
@@ -14,6 +60,11 @@ class LoggameraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         import voluptuous as vol
         
         errors = {}
+        placeholders = {
+            "vattern": "Lake Vättern",
+            "mullsjon": "Lake Mullsjön",
+            "invalid_ids": "",
+        }
         
         if user_input is not None:
             # Get selected sensors
@@ -23,17 +74,37 @@ class LoggameraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if user_input.get("sensor_mullsjon", False):
                 selected_sensors.append(21)
             
+            # Additional Loggamera ids entered as a list
+            try:
+                extra_sensors = parse_sensor_ids(user_input.get("sensor_ids", ""))
+            except ValueError:
+                extra_sensors = []
+                errors["sensor_ids"] = "invalid_sensor_ids"
+            
+            new_sensors = [
+                sensor_id for sensor_id in dict.fromkeys(extra_sensors)
+                if sensor_id not in selected_sensors
+            ]
+            if new_sensors:
+                invalid_ids = await async_validate_sensor_ids(self.hass, new_sensors)
+                if invalid_ids:
+                    errors["sensor_ids"] = "unreachable_sensor_ids"
+                    placeholders["invalid_ids"] = ", ".join(str(sensor_id) for sensor_id in invalid_ids)
+            selected_sensors.extend(new_sensors)
+            
             # Validate that at least one sensor is selected
-            if not selected_sensors:
+            if not errors and not selected_sensors:
                 errors["base"] = "no_sensors_selected"
-            else:
-                # Set unique ID to prevent duplicate config entries
-                await self.async_set_unique_id(DOMAIN)
-                self._abort_if_unique_id_configured()
+            elif not errors:
+                # Further entries, e.g. with other ids or settings, are
+                # told apart by their ids
+                title = "Badtemperaturer Hjo Energi"
+                if self._async_current_entries():
+                    title = f"Loggamera {', '.join(str(sensor_id) for sensor_id in selected_sensors)}"
                 
                 # Create config entry with selected sensors
                 return self.async_create_entry(
-                    title="Badtemperaturer Hjo Energi",
+                    title=title,
                     data={
                         "sensors": selected_sensors,
                         "scan_interval": DEFAULT_SCAN_INTERVAL
@@ -45,10 +116,59 @@ class LoggameraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=vol.Schema({
                 vol.Optional("sensor_vattern", default=True): bool,
                 vol.Optional("sensor_mullsjon", default=True): bool,
+                vol.Optional("sensor_ids", default=""): str,
             }),
             errors=errors,
-            description_placeholders={
-                "vattern": "Lake Vättern",
-                "mullsjon": "Lake Mullsjön"
-            }
-        ) 
\ No newline at end of file
+            description_placeholders=placeholders
+        )
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow for an entry."""
+        return LoggameraOptionsFlow(config_entry)
+
+class LoggameraOptionsFlow(config_entries.OptionsFlow):
+    """Handle feature and tuning options of a Loggamera entry.
+
+    Saving the options reloads the entry so they take effect.
+    """
+
+    def __init__(self, config_entry):
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Show and save the options."""
+        import voluptuous as vol
+        
+        if user_input is not None:
+            # An empty address means the real portal
+            if not user_input.get("portal_url"):
+                user_input.pop("portal_url", None)
+            return self.async_create_entry(title="", data=user_input)
+        
+        current = {**self._entry.data, **self._entry.options}
+        
+        def _default(key: str, default):
+            return vol.Optional(key, default=current.get(key, default))
+        
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                _default("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+                _default("request_timeout", DEFAULT_REQUEST_TIMEOUT): vol.All(vol.Coerce(float), vol.Range(min=1, max=120)),
+                _default("adaptive_polling", DEFAULT_ADAPTIVE_POLLING): bool,
+                _default("parse_in_executor", DEFAULT_PARSE_IN_EXECUTOR): bool,
+                _default("extract_all_values", DEFAULT_EXTRACT_ALL_VALUES): bool,
+                _default("derived_sensors", DEFAULT_DERIVED_SENSORS): bool,
+                _default("validate_readings", DEFAULT_VALIDATE_READINGS): bool,
+                _default("outlier_window", OUTLIER_WINDOW): vol.All(vol.Coerce(int), vol.Range(min=5, max=99)),
+                _default("outlier_threshold", OUTLIER_THRESHOLD): vol.All(vol.Coerce(float), vol.Range(min=1, max=10)),
+                _default("outlier_min_spread", OUTLIER_MIN_SPREAD): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                _default("collect_metrics", DEFAULT_COLLECT_METRICS): bool,
+                _default("record_volatile_attributes", DEFAULT_RECORD_VOLATILE_ATTRIBUTES): bool,
+                _default("profile_startup", DEFAULT_PROFILE_STARTUP): bool,
+                vol.Optional("portal_url", description={"suggested_value": current.get("portal_url")}): str,
+            }),
+        )
@@ -5,6 +5,52 @@ DEFAULT_SCAN_INTERVAL = 300  # 5 minutes in seconds
 MIN_SCAN_INTERVAL = 60       # 1 minute minimum
 MAX_SCAN_INTERVAL = 86400    # 24 hours maximum
 
+# Request settings
+PORTAL_URL = "https://portal.loggamera.se/PublicViews/OverviewInside"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4  # Parallel requests per refresh
+DEFAULT_REQUEST_TIMEOUT = 10         # Seconds per request
+READ_CHUNK_SIZE = 8192               # Bytes per streamed response chunk
+MAX_RESPONSE_BYTES = 1048576         # Largest page read before giving up
+DEFAULT_PARSE_IN_EXECUTOR = False    # Parse pages in a worker thread
+DEFAULT_ADAPTIVE_POLLING = False     # Learn each sensor's update cadence
+DEFAULT_EXTRACT_ALL_VALUES = False   # Expose every display-value as an entity
+DEFAULT_COLLECT_METRICS = False      # Record per-phase timings for diagnostics
+METRICS_WINDOW = 500                 # Samples kept per timing window
+DEFAULT_PROFILE_STARTUP = False      # Log import and setup time per module
+DEFAULT_RECORD_VOLATILE_ATTRIBUTES = False  # Record per-refresh status attributes
+
+# Connection pool settings
+CONNECTION_LIMIT_PER_HOST = 8        # Open connections to the portal
+KEEPALIVE_TIMEOUT = 75               # Seconds an idle connection is kept
+DNS_CACHE_TTL = 600                  # Seconds a DNS lookup is cached
+SINGLE_FLIGHT_FRESHNESS = 5          # Seconds a fetched result is shared
+RATE_LIMIT = 5.0                     # Sustained requests per second, all entries
+RATE_BURST = 20                      # Requests allowed at once before limiting
+
+# Circuit breaker settings
+BREAKER_FAILURE_THRESHOLD = 3        # Consecutive failures before opening
+BREAKER_BASE_BACKOFF = 60            # Seconds of first open period
+BREAKER_MAX_BACKOFF = 3600           # Longest open period in seconds
+
+# Reading history settings
+HISTORY_SIZE = 288                   # Readings kept per sensor
+HISTORY_SAVE_DELAY = 60              # Seconds to batch writes to disk
+
+# Reading series settings
+DEFAULT_DERIVED_SENSORS = False      # Add mean, trend and daily min/max sensors
+SERIES_SIZE = 288                    # Readings kept in memory per sensor
+TREND_THRESHOLD = 0.05               # Degrees per hour counted as a trend
+
+# Reading validation settings
+DEFAULT_VALIDATE_READINGS = False    # Reject spikes with a Hampel filter
+OUTLIER_WINDOW = 9                   # Recent accepted readings compared against
+OUTLIER_THRESHOLD = 3.0              # Deviations from the median to reject at
+OUTLIER_MIN_SPREAD = 0.5             # Smallest deviation used, in degrees
+
+# Statistics backfill settings
+BACKFILL_READ_ROWS = 10000           # Rows read from a dump per executor job
+BACKFILL_IMPORT_HOURS = 1000         # Hourly statistics per recorder import
+
 # Device information constants
 DEVICE_IDENTIFIER = "hjo_energi_badtemperaturer"
 DEVICE_NAME = "Hjo Energi Badtemperaturer"
@@ -0,0 +1,381 @@
+"""Data update coordinator for Loggamera integration."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from homeassistant.util import dt as dt_util
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    DOMAIN,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_PARSE_IN_EXECUTOR,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_EXTRACT_ALL_VALUES,
+    DEFAULT_COLLECT_METRICS,
+    DEFAULT_DERIVED_SENSORS,
+    DEFAULT_VALIDATE_READINGS,
+    OUTLIER_WINDOW,
+    OUTLIER_THRESHOLD,
+    OUTLIER_MIN_SPREAD,
+)
+from .backend import HtmlBackend
+from .breaker import CircuitBreaker, CircuitOpenError
+from .cache import LoggameraResponseCache
+from .client import LoggameraClient
+from .history import LoggameraHistory
+from .metrics import LoggameraMetrics, PHASE_ENTITY_WRITE
+from .series import ReadingSeries
+from .validation import ReadingValidator
+
+_LOGGER = logging.getLogger(__name__)
+
+class LoggameraDataCoordinator(DataUpdateCoordinator):
+    """Manages data fetching for all Loggamera sensors."""
+    
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: LoggameraClient,
+        sensor_ids: list,
+        scan_interval: timedelta,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        parse_in_executor: bool = DEFAULT_PARSE_IN_EXECUTOR,
+        adaptive_polling: bool = DEFAULT_ADAPTIVE_POLLING,
+        extract_all_values: bool = DEFAULT_EXTRACT_ALL_VALUES,
+        collect_metrics: bool = DEFAULT_COLLECT_METRICS,
+        portal_url: str | None = None,
+        derived_sensors: bool = DEFAULT_DERIVED_SENSORS,
+        validate_readings: bool = DEFAULT_VALIDATE_READINGS,
+        outlier_limits: tuple[int, float, float] = (OUTLIER_WINDOW, OUTLIER_THRESHOLD, OUTLIER_MIN_SPREAD),
+        history: LoggameraHistory | None = None,
+        entry_id: str | None = None,
+    ):
+        """Initialize coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=scan_interval,
+        )
+        self.client = client
+        # Prefix of this entry's entity unique ids
+        self.entry_id = entry_id
+        self.sensor_ids = sensor_ids
+        self.request_timeout = request_timeout
+        self.portal_url = portal_url
+        self.parse_in_executor = parse_in_executor
+        self.extract_all_values = extract_all_values
+        self.page_readings: dict[int, list] = {}
+        self._semaphore = asyncio.Semaphore(max(1, int(max_concurrent)))
+        self.cache = LoggameraResponseCache()
+        self.breakers: dict[int, CircuitBreaker] = {}
+        self.scheduler = None
+        if adaptive_polling:
+            from .scheduler import AdaptivePollScheduler
+            self.scheduler = AdaptivePollScheduler(scan_interval.total_seconds())
+        self.history = history
+        self.metrics = LoggameraMetrics() if collect_metrics else None
+        
+        # Recent readings per sensor for the derived statistics sensors,
+        # seeded from the stored history
+        self.series: dict[int, ReadingSeries] | None = None
+        if derived_sensors:
+            self.series = {}
+            if history is not None:
+                for sensor_id in sensor_ids:
+                    for timestamp, temperature in history.readings(sensor_id):
+                        self._series(sensor_id).add(timestamp, temperature)
+        
+        # Outlier filters per sensor, warmed up with the stored history
+        self.outlier_limits = outlier_limits
+        self.validators: dict[int, ReadingValidator] | None = None
+        if validate_readings:
+            self.validators = {}
+            if history is not None:
+                for sensor_id in sensor_ids:
+                    validator = self._validator(sensor_id)
+                    validator.filter(temperature for _, temperature in history.readings(sensor_id))
+                    validator.rejected = 0
+        
+        self.backend = HtmlBackend(self)
+        self.data = {}
+        # Update callbacks of the entities of each sensor
+        self._sensor_listeners: dict[int, dict[CALLBACK_TYPE, None]] = {}
+        self.last_update = None
+        
+        # Status tracking
+        self.status = "Starting..."
+        self.last_error = None
+        self.successful_updates = 0
+        self.failed_updates = 0
+        
+        # Time spent parsing on the event loop during the last refresh
+        self.loop_blocked_seconds = 0.0
+        
+        # Time taken by the config entry setup, set once it finishes
+        self.setup_seconds = None
+        
+        # Per-module import and setup timings when startup profiling is on
+        self.startup_profile = None
+    
+    @callback
+    def async_add_sensor_listener(self, sensor_id: int, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for new data of one sensor. Return a function that stops listening."""
+        listeners = self._sensor_listeners.setdefault(sensor_id, {})
+        listeners[update_callback] = None
+        
+        @callback
+        def remove_listener() -> None:
+            listeners.pop(update_callback, None)
+        
+        return remove_listener
+    
+    @callback
+    def async_update_sensor_listeners(self, sensor_id: int) -> None:
+        """Update the entities of one sensor."""
+        for update_callback in list(self._sensor_listeners.get(sensor_id, ())):
+            update_callback()
+    
+    @property
+    def scan_interval(self) -> int:
+        """Return the configured polling interval in seconds."""
+        # Under adaptive polling update_interval is the next wake-up instead
+        if self.scheduler is not None:
+            return int(self.scheduler.base_interval)
+        return int(self.update_interval.total_seconds())
+    
+    def set_scan_interval(self, seconds: int) -> None:
+        """Change the polling interval, effective from the next refresh."""
+        if self.scheduler is not None:
+            self.scheduler.base_interval = seconds
+        else:
+            self.update_interval = timedelta(seconds=seconds)
+    
+    def set_sensor_ids(self, sensor_ids: list) -> None:
+        """Change the polled sensors, dropping all state kept for removed ones."""
+        for sensor_id in set(self.sensor_ids) - set(sensor_ids):
+            self.data.pop(sensor_id, None)
+            self.page_readings.pop(sensor_id, None)
+            self.breakers.pop(sensor_id, None)
+            self.cache.invalidate(sensor_id)
+            if self.scheduler is not None:
+                self.scheduler.forget(sensor_id)
+            if self.series is not None:
+                self.series.pop(sensor_id, None)
+            if self.validators is not None:
+                self.validators.pop(sensor_id, None)
+        self.sensor_ids = list(sensor_ids)
+    
+    def restore_from_history(self) -> bool:
+        """Populate data from stored readings. Return True if any were found."""
+        if self.history is None:
+            return False
+        latest = self.history.latest()
+        restored = {
+            sensor_id: {
+                'temperature': temperature,
+                'available': True,
+                'last_update': datetime.fromtimestamp(timestamp)
+            }
+            for sensor_id, (timestamp, temperature) in latest.items()
+            if sensor_id in self.sensor_ids
+        }
+        if not restored:
+            return False
+        self.data = restored
+        newest = max(latest[sensor_id][0] for sensor_id in restored)
+        self.last_update = dt_util.as_local(dt_util.utc_from_timestamp(newest))
+        self.status = "Restored"
+        return True
+        
+    async def _async_update_data(self):
+        """Fetch data from all sensors."""
+        errors = []
+        self.loop_blocked_seconds = 0.0
+        
+        # With adaptive polling only sensors that are due are fetched;
+        # the others keep their previous reading
+        sensor_ids = self.sensor_ids
+        if self.scheduler is not None:
+            sensor_ids = self.scheduler.due(self.sensor_ids, time.monotonic())
+            if not sensor_ids:
+                self._schedule_next_refresh()
+                return self.data
+        self.data = {
+            sensor_id: self.data[sensor_id]
+            for sensor_id in self.sensor_ids
+            if sensor_id in self.data
+        }
+        
+        # Fetch all sensors concurrently, bounded by the semaphore
+        if self.backend.batched:
+            results = await self.backend.async_fetch_batch(sensor_ids)
+            for sensor_id, result in zip(sensor_ids, results):
+                self._apply_result(sensor_id, result, errors)
+        else:
+            # Each sensor is applied and pushed to its own entities as soon as
+            # its fetch finishes, so a slow sensor does not hold back the rest.
+            # All entities are updated once more when the refresh is done.
+            for completed in asyncio.as_completed(
+                [self._fetch_tagged(sensor_id) for sensor_id in sensor_ids]
+            ):
+                sensor_id, result = await completed
+                self._apply_result(sensor_id, result, errors)
+                if self.metrics is None:
+                    self.async_update_sensor_listeners(sensor_id)
+                else:
+                    started = time.perf_counter()
+                    self.async_update_sensor_listeners(sensor_id)
+                    self.metrics.record(sensor_id, PHASE_ENTITY_WRITE, (time.perf_counter() - started) * 1000)
+        _LOGGER.debug(
+            f"Event loop blocked {self.loop_blocked_seconds * 1000:.1f} ms by parsing this refresh"
+        )
+        
+        # Update status
+        success_count = len(sensor_ids) - len(errors)
+        if success_count == len(sensor_ids):
+            self.status = "OK"
+            self.last_error = None
+            self.successful_updates += 1
+        elif success_count > 0:
+            self.status = "Partial"
+            self.last_error = f"Some sensors failed: {'; '.join(errors)}"
+            self.failed_updates += 1
+        else:
+            self.status = "Error"
+            self.last_error = f"All sensors failed: {'; '.join(errors)}"
+            self.failed_updates += 1
+        
+        self.last_update = dt_util.now()
+        self._schedule_next_refresh()
+        
+        return self.data
+    
+    def _apply_result(self, sensor_id: int, result, errors: list) -> None:
+        """Store the outcome of one sensor fetch in the coordinator data."""
+        now = time.monotonic()
+        if isinstance(result, BaseException):
+            # Requests skipped by an open circuit are not new failures
+            if isinstance(result, CircuitOpenError):
+                _LOGGER.debug(f"Skipped sensor {sensor_id}: {result}")
+            else:
+                self._breaker(sensor_id).record_failure(now)
+                if self.scheduler is not None:
+                    self.scheduler.record_failure(sensor_id, now)
+                _LOGGER.warning(f"Failed to fetch data for sensor {sensor_id}: {result}")
+            errors.append(f"Sensor {sensor_id}: {str(result)}")
+            self.data[sensor_id] = {
+                'temperature': None,
+                'available': False,
+                'last_update': self.data.get(sensor_id, {}).get('last_update')
+            }
+            return
+        
+        self._breaker(sensor_id).record_success()
+        # A page that was parsed again is a new sample even if it shows the same value
+        new_sample = self.cache.take_new_sample(sensor_id)
+        if self.validators is not None and not self._validator(sensor_id).accept(result, new_sample):
+            # The page was fetched fine but shows a glitch; keep the last
+            # reading, and let the scheduler see an unchanged value so the
+            # glitch is neither polled for again at once nor taken as an update
+            if self.scheduler is not None:
+                previous = self.data.get(sensor_id, {}).get('temperature')
+                self.scheduler.record_success(sensor_id, previous if previous is not None else result, now)
+            _LOGGER.debug(f"Rejected outlier {result}°C for sensor {sensor_id}")
+            return
+        if self.scheduler is not None:
+            self.scheduler.record_success(sensor_id, result, now)
+        timestamp = datetime.now()
+        self.data[sensor_id] = {
+            'temperature': result,
+            'available': True,
+            'last_update': timestamp
+        }
+        if self.extract_all_values:
+            self.data[sensor_id]['readings'] = self.page_readings.get(sensor_id, [])
+        if self.history is not None:
+            self.history.async_record(sensor_id, result, timestamp)
+        if self.series is not None:
+            self._series(sensor_id).add(timestamp.timestamp(), result)
+        self.last_update = dt_util.now()
+        _LOGGER.debug(f"Successfully fetched {result}°C for sensor {sensor_id}")
+    
+    def _validator(self, sensor_id: int) -> ReadingValidator:
+        """Return the outlier filter for a sensor."""
+        validator = self.validators.get(sensor_id)
+        if validator is None:
+            validator = self.validators[sensor_id] = ReadingValidator(*self.outlier_limits)
+        return validator
+    
+    def _series(self, sensor_id: int) -> ReadingSeries:
+        """Return the reading series for a sensor."""
+        series = self.series.get(sensor_id)
+        if series is None:
+            series = self.series[sensor_id] = ReadingSeries()
+        return series
+    
+    def _breaker(self, sensor_id: int) -> CircuitBreaker:
+        """Return the circuit breaker for a sensor."""
+        breaker = self.breakers.get(sensor_id)
+        if breaker is None:
+            breaker = self.breakers[sensor_id] = CircuitBreaker()
+        return breaker
+    
+    def _check_circuit(self, sensor_id: int) -> None:
+        """Fail fast if the sensor's circuit is open."""
+        breaker = self._breaker(sensor_id)
+        if not breaker.allow(time.monotonic()):
+            retry_in = max(0, breaker.retry_at - time.monotonic())
+            raise CircuitOpenError(f"Circuit open after repeated failures, retrying in {retry_in:.0f} s")
+    
+    def _schedule_next_refresh(self) -> None:
+        """Wake up again when the next sensor is due under adaptive polling."""
+        if self.scheduler is None:
+            return
+        delay = self.scheduler.next_refresh_in(self.sensor_ids, time.monotonic())
+        self.update_interval = timedelta(seconds=delay)
+    
+    async def run_limited(self, kind: str, location_id: int, fetch):
+        """Run a backend fetch behind the circuit breaker and concurrency limit.
+        
+        Concurrent requests for the same id, from this or other entries,
+        share a single upstream fetch.
+        """
+        self._check_circuit(location_id)
+        
+        async def limited():
+            async with self._semaphore:
+                return await fetch()
+        
+        try:
+            return await self.client.inflight.run(
+                (kind, self.backend.name, self.portal_url, location_id, self.extract_all_values), limited
+            )
+        except asyncio.CancelledError:
+            # Nobody will record the outcome, so let the next refresh retry
+            self._breaker(location_id).cancel_trial()
+            raise
+    
+    async def _fetch_limited(self, location_id: int) -> float:
+        """Fetch temperature while holding a slot in the concurrency limit."""
+        async def fetch():
+            temperature = await self.backend.async_fetch(location_id)
+            return temperature, self.page_readings.get(location_id)
+        
+        temperature, readings = await self.run_limited("temperature", location_id, fetch)
+        if readings is not None:
+            self.page_readings[location_id] = readings
+        return temperature
+    
+    async def _fetch_tagged(self, location_id: int) -> tuple:
+        """Fetch temperature and return it, or the error, with its sensor id."""
+        try:
+            return location_id, await self._fetch_limited(location_id)
+        except Exception as err:
+            return location_id, err
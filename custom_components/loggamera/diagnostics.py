@@ -0,0 +1,44 @@
+"""Diagnostics support for Loggamera integration."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id].coordinator
+
+    return {
+        "config": dict(entry.data),
+        "options": dict(entry.options),
+        "backend": coordinator.backend.name,
+        "status": coordinator.status,
+        "last_update": coordinator.last_update.isoformat() if coordinator.last_update else None,
+        "last_error": coordinator.last_error,
+        "successful_updates": coordinator.successful_updates,
+        "failed_updates": coordinator.failed_updates,
+        "update_interval_seconds": coordinator.update_interval.total_seconds(),
+        "setup_ms": round(coordinator.setup_seconds * 1000) if coordinator.setup_seconds is not None else None,
+        "startup_profile": coordinator.startup_profile,
+        "loop_blocked_ms": round(coordinator.loop_blocked_seconds * 1000, 1),
+        "cache": {"hits": coordinator.cache.hits, "misses": coordinator.cache.misses},
+        "inflight": {
+            "started": coordinator.client.inflight.started,
+            "shared": coordinator.client.inflight.shared,
+        },
+        "rate_limiter": coordinator.client.limiter.as_dict(),
+        "breakers": {
+            str(sensor_id): {"state": breaker.state, "failures": breaker.failures}
+            for sensor_id, breaker in coordinator.breakers.items()
+        },
+        "sensors": {str(sensor_id): sensor_data for sensor_id, sensor_data in coordinator.data.items()},
+        "rejected_readings": (
+            {str(sensor_id): validator.rejected for sensor_id, validator in coordinator.validators.items()}
+            if coordinator.validators is not None else None
+        ),
+        "metrics": coordinator.metrics.as_dict() if coordinator.metrics is not None else None,
+    }
@@ -0,0 +1,27 @@
+"""Shared entity helpers for Loggamera integration."""
+
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN, SENSORS, DEVICE_IDENTIFIER, DEVICE_NAME, DEVICE_MANUFACTURER, DEVICE_MODEL, DEVICE_SW_VERSION
+
+
+def hub_device_info(entry_id: str) -> DeviceInfo:
+    """Return the device that holds a config entry's entities."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{entry_id}_{DEVICE_IDENTIFIER}")},
+        name=DEVICE_NAME,
+        manufacturer=DEVICE_MANUFACTURER,
+        model=DEVICE_MODEL,
+        sw_version=DEVICE_SW_VERSION,
+    )
+
+
+def lake_device_info(entry_id: str, sensor_id: int) -> DeviceInfo:
+    """Return the device for one Loggamera id, connected through the entry's device."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{entry_id}_{sensor_id}")},
+        name=SENSORS.get(sensor_id, f"Loggamera {sensor_id}"),
+        manufacturer=DEVICE_MANUFACTURER,
+        model=f"Loggamera {sensor_id}",
+        via_device=(DOMAIN, f"{entry_id}_{DEVICE_IDENTIFIER}"),
+    )
@@ -0,0 +1,200 @@
+"""Persistent reading history for Loggamera sensors."""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from .const import DOMAIN, HISTORY_SIZE, HISTORY_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# The journal is rewritten with only the kept readings once it holds this
+# many times as many lines
+JOURNAL_COMPACT_FACTOR = 4
+
+
+def _read_journal(path: str) -> tuple[dict[int, list[list[float]]], int]:
+    """Return the readings in a journal file and its number of lines."""
+    readings: dict[int, list[list[float]]] = {}
+    lines = 0
+    try:
+        with open(path, encoding="ascii") as handle:
+            for line in handle:
+                lines += 1
+                try:
+                    sensor_id, timestamp, temperature = line.split(",")
+                    readings.setdefault(int(sensor_id), []).append([int(timestamp), float(temperature)])
+                except ValueError:
+                    # A line cut short by a crash is skipped
+                    continue
+    except FileNotFoundError:
+        pass
+    return readings, lines
+
+
+def _journal_lines(readings: dict[int, list[list[float]]]) -> list[str]:
+    """Return journal lines for all readings."""
+    return [
+        f"{sensor_id},{timestamp},{temperature!r}\n"
+        for sensor_id, sensor_readings in readings.items()
+        for timestamp, temperature in sensor_readings
+    ]
+
+
+def _append_journal(path: str, lines: list[str]) -> None:
+    """Append lines to the journal."""
+    with open(path, "a", encoding="ascii") as handle:
+        handle.writelines(lines)
+
+
+def _rewrite_journal(path: str, lines: list[str]) -> None:
+    """Replace the journal with the given lines."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="ascii") as handle:
+        handle.writelines(lines)
+    os.replace(temporary, path)
+
+
+class LoggameraHistory:
+    """Recent readings per sensor, kept in an append-only journal.
+
+    Each reading is one short ``sensor_id,timestamp,temperature`` line.
+    New readings are collected and appended in one write every
+    HISTORY_SAVE_DELAY seconds, so a save costs the readings since the
+    last one rather than the whole history. Once the journal has grown to
+    JOURNAL_COMPACT_FACTOR times the readings that are kept it is
+    rewritten with just those, which happens once every few days.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, size: int = HISTORY_SIZE):
+        """Initialize history."""
+        self._hass = hass
+        self._path = hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.history.csv")
+        # Earlier versions kept the history as a single JSON document
+        self._legacy_store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.history")
+        self._size = size
+        self._readings: dict[int, list[list[float]]] = {}
+        self._pending: list[str] = []
+        self._journal_lines = 0
+        self._lock = asyncio.Lock()
+        self._unsub_flush = None
+        self._unsub_final_write = None
+
+    async def async_load(self) -> dict[int, list[list[float]]]:
+        """Load stored readings from disk."""
+        try:
+            readings, self._journal_lines = await self._hass.async_add_executor_job(_read_journal, self._path)
+            if not self._journal_lines:
+                readings = await self._async_migrate_store()
+        except Exception as err:
+            _LOGGER.warning(f"Could not load stored readings: {err}")
+            readings = {}
+        self._readings = {
+            sensor_id: sensor_readings[-self._size:]
+            for sensor_id, sensor_readings in readings.items()
+        }
+        self._unsub_final_write = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
+        return self._readings
+
+    async def _async_migrate_store(self) -> dict[int, list[list[float]]]:
+        """Move readings from the old JSON store into the journal."""
+        stored = await self._legacy_store.async_load()
+        if not stored:
+            return {}
+        readings = {
+            int(sensor_id): sensor_readings[-self._size:]
+            for sensor_id, sensor_readings in stored.get("readings", {}).items()
+        }
+        lines = _journal_lines(readings)
+        await self._hass.async_add_executor_job(_rewrite_journal, self._path, lines)
+        self._journal_lines = len(lines)
+        await self._legacy_store.async_remove()
+        _LOGGER.debug(f"Moved {len(lines)} stored readings to {self._path}")
+        return readings
+
+    def latest(self) -> dict[int, tuple[float, float]]:
+        """Return the most recent (timestamp, temperature) for each sensor."""
+        return {
+            sensor_id: (readings[-1][0], readings[-1][1])
+            for sensor_id, readings in self._readings.items()
+            if readings
+        }
+
+    def readings(self, sensor_id: int) -> list[list[float]]:
+        """Return the stored [timestamp, temperature] pairs for a sensor, oldest first."""
+        return list(self._readings.get(sensor_id, []))
+
+    @callback
+    def async_record(self, sensor_id: int, temperature: float, timestamp: datetime) -> None:
+        """Append a reading and schedule a save."""
+        reading = [round(timestamp.timestamp()), temperature]
+        readings = self._readings.setdefault(sensor_id, [])
+        readings.append(reading)
+        if len(readings) > self._size:
+            del readings[:-self._size]
+        self._pending.append(f"{sensor_id},{reading[0]},{temperature!r}\n")
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self._hass, HISTORY_SAVE_DELAY, self._async_scheduled_flush)
+
+    async def _async_scheduled_flush(self, _now) -> None:
+        """Write pending readings when the save delay has passed."""
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def _async_final_write(self, _event) -> None:
+        """Write pending readings before Home Assistant stops."""
+        self._unsub_final_write = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Append pending readings to the journal, compacting it when it has grown."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        async with self._lock:
+            if not self._pending:
+                return
+            lines, self._pending = self._pending, []
+            kept = sum(len(readings) for readings in self._readings.values())
+            try:
+                if self._journal_lines + len(lines) > JOURNAL_COMPACT_FACTOR * max(kept, self._size):
+                    lines = _journal_lines(self._readings)
+                    await self._hass.async_add_executor_job(_rewrite_journal, self._path, lines)
+                    self._journal_lines = len(lines)
+                else:
+                    await self._hass.async_add_executor_job(_append_journal, self._path, lines)
+                    self._journal_lines += len(lines)
+            except OSError as err:
+                _LOGGER.warning(f"Could not save readings: {err}")
+
+    async def async_unload(self) -> None:
+        """Write pending readings and stop listening for shutdown."""
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+        await self.async_flush()
+
+    async def async_remove(self) -> None:
+        """Delete the stored history."""
+        self._pending = []
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        def _remove() -> None:
+            try:
+                os.remove(self._path)
+            except FileNotFoundError:
+                pass
+
+        await self._hass.async_add_executor_job(_remove)
+        await self._legacy_store.async_remove()
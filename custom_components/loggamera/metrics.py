@@ -0,0 +1,85 @@
+"""Rolling per-phase timing metrics for Loggamera refreshes."""
+
+import math
+from collections import deque
+
+from .const import METRICS_WINDOW
+
+PHASE_RATE_LIMIT = "rate_limit_wait"
+PHASE_CONNECT = "connect"
+PHASE_TRANSFER = "transfer"
+PHASE_PARSE = "parse"
+PHASE_ENTITY_WRITE = "entity_write"
+RESPONSE_BYTES = "response_bytes"
+
+TIMING_PHASES = (PHASE_RATE_LIMIT, PHASE_CONNECT, PHASE_TRANSFER, PHASE_PARSE, PHASE_ENTITY_WRITE)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of an ordered list."""
+    index = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[index]
+
+
+class RollingWindow:
+    """The most recent samples of one metric."""
+
+    __slots__ = ("_samples",)
+
+    def __init__(self, size: int):
+        """Initialize window."""
+        self._samples = deque(maxlen=size)
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the oldest when full."""
+        self._samples.append(value)
+
+    def summary(self) -> dict:
+        """Return p50/p95/p99 and the sample count."""
+        if not self._samples:
+            return {"p50": None, "p95": None, "p99": None, "samples": 0}
+        ordered = sorted(self._samples)
+        return {
+            "p50": round(_percentile(ordered, 0.50), 2),
+            "p95": round(_percentile(ordered, 0.95), 2),
+            "p99": round(_percentile(ordered, 0.99), 2),
+            "samples": len(ordered),
+        }
+
+
+class LoggameraMetrics:
+    """Per-sensor and overall rolling windows for each refresh phase.
+
+    Timings are recorded in milliseconds and response sizes in bytes.
+    Percentiles are only computed when a summary is requested.
+    """
+
+    def __init__(self, size: int = METRICS_WINDOW):
+        """Initialize metrics."""
+        self._size = size
+        self._windows: dict[tuple[int | None, str], RollingWindow] = {}
+
+    def record(self, sensor_id: int | None, metric: str, value: float) -> None:
+        """Record a sample for a sensor and for the overall window."""
+        keys = ((None, metric),) if sensor_id is None else ((sensor_id, metric), (None, metric))
+        for key in keys:
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = RollingWindow(self._size)
+            window.add(value)
+
+    def summary(self, sensor_id: int | None = None, metric: str | None = None) -> dict:
+        """Return summaries for one sensor (or overall), optionally for one metric."""
+        return {
+            key_metric: window.summary()
+            for (key_sensor, key_metric), window in self._windows.items()
+            if key_sensor == sensor_id and (metric is None or key_metric == metric)
+        }
+
+    def as_dict(self) -> dict:
+        """Return all summaries, overall and per sensor."""
+        sensor_ids = sorted({sensor_id for sensor_id, _ in self._windows if sensor_id is not None})
+        return {
+            "overall": self.summary(),
+            "sensors": {str(sensor_id): self.summary(sensor_id) for sensor_id in sensor_ids},
+        }
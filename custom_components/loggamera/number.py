@@ -7,7 +7,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 
-from .const import DOMAIN, DEVICE_IDENTIFIER, DEVICE_NAME, DEVICE_MANUFACTURER, DEVICE_MODEL, DEVICE_SW_VERSION
+from .const import DOMAIN
+from .entity import hub_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,16 +20,17 @@ async def async_setup_entry(
     """Set up Loggamera number entities."""
     
     # Create update interval entity
-    async_add_entities([LoggameraUpdateIntervalNumber(config_entry)], True)
+    runtime = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities([LoggameraUpdateIntervalNumber(runtime)], True)
 
 class LoggameraUpdateIntervalNumber(NumberEntity):
     """Number entity for configuring update interval."""
 
-    def __init__(self, config_entry: ConfigEntry):
+    def __init__(self, runtime):
         """Initialize the number entity."""
-        self._config_entry = config_entry
+        self._runtime = runtime
         self._attr_name = "Uppdateringsintervall"
-        self._attr_unique_id = f"{DOMAIN}_update_interval"
+        self._attr_unique_id = f"{runtime.entry.entry_id}_update_interval"
         self._attr_native_min_value = 60  # 1 minute
         self._attr_native_max_value = 86400  # 24 hours  
         self._attr_native_step = 60  # 1 minute steps
@@ -36,44 +38,22 @@ class LoggameraUpdateIntervalNumber(NumberEntity):
         self._attr_mode = "box"
         self._attr_icon = "mdi:timer-cog"
         
-        # Get current value from config entry
-        current_interval = config_entry.data.get("scan_interval", 300)
-        self._attr_native_value = current_interval
+        # Get current value from the running coordinator
+        self._attr_native_value = runtime.scan_interval
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, DEVICE_IDENTIFIER)},
-            name=DEVICE_NAME,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL,
-            sw_version=DEVICE_SW_VERSION,
-        )
+        return hub_device_info(self._runtime.entry.entry_id)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the scan interval."""
-        from datetime import timedelta
-        
-        # Update config entry data
-        new_data = dict(self._config_entry.data)
-        new_data["scan_interval"] = int(value)
-        
-        self.hass.config_entries.async_update_entry(
-            self._config_entry, data=new_data
-        )
+        # Applied to the running coordinator, no reload needed
+        self._runtime.async_set_scan_interval(int(value))
         
         self._attr_native_value = value
         self.async_write_ha_state()
         
-        _LOGGER.info(f"Updated scan interval to {int(value)} seconds")
-        
-        # Update coordinator if it exists
-        if DOMAIN in self.hass.data and "coordinator" in self.hass.data[DOMAIN]:
-            coordinator = self.hass.data[DOMAIN]["coordinator"]
-            coordinator.update_interval = timedelta(seconds=int(value))
-            _LOGGER.info(f"Updated coordinator scan interval to {int(value)} seconds")
-        
         # Notify user that restart may be needed for full effect
         from homeassistant.components.persistent_notification import async_create
         async_create(
@@ -81,5 +61,5 @@ class LoggameraUpdateIntervalNumber(NumberEntity):
             f"Update interval changed to {int(value/60)} minutes. "
             "Sensors will use new interval immediately.",
             title="Badtemperaturer Hjo Energi",
-            notification_id=f"{DOMAIN}_interval_changed"
+            notification_id=f"{DOMAIN}_{self._runtime.entry.entry_id}_interval_changed"
         ) 
\ No newline at end of file
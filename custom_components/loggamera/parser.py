@@ -0,0 +1,175 @@
+"""Streaming temperature extraction for Loggamera OverviewInside pages."""
+
+import re
+from html.parser import HTMLParser
+
+DISPLAY_VALUE_CLASS = "display-value"
+MIN_VALID_TEMPERATURE = -5
+MAX_VALID_TEMPERATURE = 40
+MAX_LABEL_LENGTH = 64
+
+_NUMBER_RE = re.compile(r'([-+]?\d*[.,]?\d+)')
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Elements without a closing tag must not count towards nesting depth
+_VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+# Elements whose text is never a label
+_IGNORED_ELEMENTS = frozenset({"script", "style", "title"})
+
+
+def parse_display_value(text: str) -> float | None:
+    """Return the temperature in a display-value text, or None if invalid."""
+    match = _NUMBER_RE.search(text.strip())
+    if not match:
+        return None
+    value = float(match.group(1).replace(",", "."))
+    if MIN_VALID_TEMPERATURE <= value <= MAX_VALID_TEMPERATURE:
+        return value
+    return None
+
+
+def _slugify(text: str) -> str:
+    """Return an ASCII key for a label."""
+    text = text.lower().translate(str.maketrans("åäöé", "aaoe"))
+    return _SLUG_RE.sub("_", text).strip("_")
+
+
+def parse_reading(label: str | None, text: str) -> dict | None:
+    """Return a labeled reading for a display-value text, or None if not numeric."""
+    text = " ".join(text.split())
+    match = _NUMBER_RE.search(text)
+    if not match:
+        return None
+    return {
+        "label": label,
+        "value": float(match.group(1).replace(",", ".")),
+        "unit": text[match.end():].strip() or None,
+    }
+
+
+class TemperatureExtractor(HTMLParser):
+    """Incrementally extract the first valid display-value temperature.
+
+    Feed the page in chunks as they arrive and check ``done`` after each
+    chunk; once a valid reading has been found the rest of the page can be
+    discarded. With ``all_values`` the whole page is read and every other
+    numeric display-value is also collected in ``readings``, labeled with
+    the nearest text before it.
+    """
+
+    def __init__(self, all_values: bool = False):
+        """Initialize extractor."""
+        super().__init__(convert_charrefs=True)
+        self.all_values = all_values
+        self.temperature = None
+        self.readings = []
+        self._depth = 0
+        self._text = []
+        self._label = None
+        self._label_parts = []
+        self._ignored = 0
+        self._keys = set()
+
+    @property
+    def done(self) -> bool:
+        """Return True once nothing more is needed from the page."""
+        return self.temperature is not None and not self.all_values
+
+    def feed(self, data: str) -> None:
+        """Feed a chunk of the page, ignoring input once done."""
+        if not self.done:
+            super().feed(data)
+
+    def handle_starttag(self, tag, attrs):
+        """Start capturing text when a display-value element opens."""
+        if self.done:
+            return
+        self._end_label()
+        if tag in _VOID_ELEMENTS:
+            return
+        if tag in _IGNORED_ELEMENTS:
+            self._ignored += 1
+        if self._depth:
+            self._depth += 1
+            return
+        for name, value in attrs:
+            if name == "class" and value and DISPLAY_VALUE_CLASS in value.split():
+                self._depth = 1
+                self._text = []
+                return
+
+    def handle_endtag(self, tag):
+        """Evaluate captured text when the display-value element closes."""
+        self._end_label()
+        if tag in _IGNORED_ELEMENTS and self._ignored:
+            self._ignored -= 1
+        if not self._depth or tag in _VOID_ELEMENTS:
+            return
+        self._depth -= 1
+        if not self._depth:
+            text = "".join(self._text)
+            self._text = []
+            if self.temperature is None:
+                self.temperature = parse_display_value(text)
+                if self.temperature is not None:
+                    # Shown as the temperature entity, not again as a reading
+                    self._label = None
+                    return
+            if self.all_values:
+                self._add_reading(text)
+
+    def handle_data(self, data):
+        """Collect text inside a display-value element, or remember it as a label."""
+        if self._depth:
+            self._text.append(data)
+        elif self.all_values and not self._ignored:
+            self._label_parts.append(data)
+
+    def _end_label(self) -> None:
+        """Use the text collected since the last tag as the current label."""
+        if not self._label_parts:
+            return
+        text = " ".join("".join(self._label_parts).split())
+        self._label_parts = []
+        if text:
+            self._label = text[:MAX_LABEL_LENGTH]
+
+    def _add_reading(self, text: str) -> None:
+        """Record a labeled reading with a unique key."""
+        reading = parse_reading(self._label, text)
+        if reading is None:
+            return
+        base_key = _slugify(self._label or "") or "value"
+        key, suffix = base_key, 2
+        while key in self._keys:
+            key = f"{base_key}_{suffix}"
+            suffix += 1
+        self._keys.add(key)
+        reading["key"] = key
+        self.readings.append(reading)
+        self._label = None
+
+
+def extract_temperature(html: str) -> float | None:
+    """Return the first valid temperature in a complete page."""
+    extractor = TemperatureExtractor()
+    extractor.feed(html)
+    return extractor.temperature
+
+
+def parse_pages(pages: list[tuple[bytes, str | None]], all_values: bool = False) -> list[tuple[float | None, list]]:
+    """Return (temperature, readings) for each (body, charset) page in a batch.
+
+    Runs without touching the event loop so a whole refresh can be parsed
+    in a single executor job.
+    """
+    results = []
+    for body, charset in pages:
+        extractor = TemperatureExtractor(all_values)
+        extractor.feed(body.decode(charset or "utf-8", errors="replace"))
+        extractor.close()
+        results.append((extractor.temperature, extractor.readings))
+    return results
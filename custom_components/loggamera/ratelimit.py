@@ -0,0 +1,104 @@
+"""Process-wide request rate limiting for the Loggamera portal."""
+
+import asyncio
+import heapq
+import itertools
+import time
+
+from .const import RATE_LIMIT, RATE_BURST
+
+# Lower numbers are served first when requests are queued
+PRIORITY_POLL = 0
+PRIORITY_INTERACTIVE = 1
+
+
+class TokenBucket:
+    """Token bucket with a priority queue of waiting requests.
+
+    Up to ``burst`` requests go out at once, after which requests are let
+    through at ``rate`` per second. Queued requests are served by
+    priority, then in arrival order, so scheduled polls are never stuck
+    behind a long list of ids being checked in the config flow. A
+    ``rate`` of None lets every request through at once.
+    """
+
+    def __init__(self, rate: float | None = RATE_LIMIT, burst: int = RATE_BURST):
+        """Initialize bucket."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._timer = None
+        self.granted = 0
+        self.queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a token."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, priority: int = PRIORITY_POLL) -> float:
+        """Wait for a token and return the seconds waited."""
+        if self.rate is None:
+            self.granted += 1
+            return 0.0
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self.granted += 1
+            return 0.0
+
+        started = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        self.queued += 1
+        self._schedule()
+        # A cancelled waiter stays in the heap and is skipped when reached
+        await future
+
+        waited = time.monotonic() - started
+        self.granted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def _schedule(self) -> None:
+        """Wake up when the next token is due, if anyone is waiting."""
+        if self._timer is not None or not self._waiters:
+            return
+        delay = max(0.0, (1 - self._tokens) / self.rate)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        """Hand out available tokens to the highest-priority waiters."""
+        self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        self._schedule()
+
+    def as_dict(self) -> dict:
+        """Return limiter settings and wait statistics."""
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "queue_depth": self.queue_depth,
+            "granted": self.granted,
+            "queued": self.queued,
+            "average_wait_ms": round(self.total_wait / self.queued * 1000, 1) if self.queued else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+        }
@@ -0,0 +1,88 @@
+"""Per-entry runtime state for Loggamera integration."""
+
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .const import DOMAIN
+from .coordinator import LoggameraDataCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LoggameraRuntimeData:
+    """Objects and live settings belonging to one config entry.
+
+    Stored in ``hass.data[DOMAIN][entry_id]``. Changes made through it are
+    applied to the running coordinator and saved to the entry without
+    reloading it, so pooled connections, the response cache and breaker
+    state are kept.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: LoggameraDataCoordinator):
+        """Initialize runtime data."""
+        self.hass = hass
+        self.entry = entry
+        self.coordinator = coordinator
+        self.entities = []
+        # Options the entry was set up with; a change means a reload
+        self.options = dict(entry.options)
+
+    @property
+    def config(self) -> dict:
+        """Return the entry's settings, options overriding data."""
+        return {**self.entry.data, **self.entry.options}
+
+    @property
+    def debug_mode(self) -> bool:
+        """Return True if detailed status is shown."""
+        return self.entry.data.get("debug_mode", False)
+
+    @property
+    def scan_interval(self) -> int:
+        """Return the configured polling interval in seconds."""
+        return self.coordinator.scan_interval
+
+    @callback
+    def _async_save(self, **changes) -> None:
+        """Save changed settings to the entry so they survive a restart."""
+        self.hass.config_entries.async_update_entry(self.entry, data={**self.entry.data, **changes})
+
+    @callback
+    def async_set_scan_interval(self, seconds: int) -> None:
+        """Change the polling interval."""
+        self.coordinator.set_scan_interval(seconds)
+        self._async_save(scan_interval=seconds)
+        _LOGGER.info(f"Updated scan interval to {seconds} seconds")
+
+    @callback
+    def async_set_debug_mode(self, enabled: bool) -> None:
+        """Turn detailed status on or off."""
+        self._async_save(debug_mode=enabled)
+        # Let the status sensor pick up its new name and attributes now
+        self.coordinator.async_update_listeners()
+
+    async def async_set_sensor_ids(self, sensor_ids: list[int]) -> None:
+        """Change the polled sensors, removing entities and devices of dropped ones."""
+        sensor_ids = list(dict.fromkeys(sensor_ids))
+        removed = set(self.coordinator.sensor_ids) - set(sensor_ids)
+        self.coordinator.set_sensor_ids(sensor_ids)
+        self._async_save(sensors=sensor_ids)
+
+        if removed:
+            registry = er.async_get(self.hass)
+            prefixes = tuple(f"{self.entry.entry_id}_{sensor_id}_" for sensor_id in removed)
+            for entity in er.async_entries_for_config_entry(registry, self.entry.entry_id):
+                if entity.unique_id.startswith(prefixes):
+                    registry.async_remove(entity.entity_id)
+            device_registry = dr.async_get(self.hass)
+            for sensor_id in removed:
+                device = device_registry.async_get_device(identifiers={(DOMAIN, f"{self.entry.entry_id}_{sensor_id}")})
+                if device is not None:
+                    device_registry.async_update_device(device.id, remove_config_entry_id=self.entry.entry_id)
+
+        _LOGGER.info(f"Now polling sensors {sensor_ids}")
+        # Entities for new sensors are added once their data arrives
+        await self.coordinator.async_request_refresh()
@@ -0,0 +1,126 @@
+"""Adaptive polling scheduler for Loggamera sensors."""
+
+from .const import MIN_SCAN_INTERVAL, MAX_SCAN_INTERVAL
+
+CADENCE_SMOOTHING = 0.3   # Weight of the newest interval in the cadence estimate
+POLL_MARGIN = 15          # Seconds after the expected update to poll
+PHASE_STEP = 30           # Seconds to shift the phase estimate when an update is seen at once
+STABLE_BACKOFF = 1.5      # Growth factor while a value stays unchanged past its cadence
+FAILURE_BACKOFF = 2.0     # Growth factor per consecutive failure
+DUE_TOLERANCE = 1.0       # Seconds early a sensor may be polled
+
+
+class SensorSchedule:
+    """Observed update cadence and next poll time for one sensor."""
+
+    __slots__ = ("next_poll", "last_poll", "cadence", "last_change", "last_value", "stable_polls", "failures")
+
+    def __init__(self):
+        """Initialize schedule."""
+        self.next_poll = 0.0
+        self.last_poll = None
+        self.cadence = None
+        self.last_change = None
+        self.last_value = None
+        self.stable_polls = 0
+        self.failures = 0
+
+
+class AdaptivePollScheduler:
+    """Learn how often each sensor produces a new reading and poll just after it.
+
+    Times are monotonic seconds. Every delay is kept within
+    MIN_SCAN_INTERVAL and MAX_SCAN_INTERVAL.
+    """
+
+    def __init__(self, base_interval: float, min_interval: float = MIN_SCAN_INTERVAL, max_interval: float = MAX_SCAN_INTERVAL):
+        """Initialize scheduler."""
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._schedules: dict[int, SensorSchedule] = {}
+
+    def _clamp(self, delay: float) -> float:
+        """Keep a delay within the configured limits."""
+        return max(self.min_interval, min(self.max_interval, delay))
+
+    def _schedule(self, sensor_id: int) -> SensorSchedule:
+        """Return the schedule for a sensor, creating it if needed."""
+        schedule = self._schedules.get(sensor_id)
+        if schedule is None:
+            schedule = self._schedules[sensor_id] = SensorSchedule()
+        return schedule
+
+    def due(self, sensor_ids: list, now: float) -> list:
+        """Return the sensors that should be polled now."""
+        return [
+            sensor_id for sensor_id in sensor_ids
+            if self._schedule(sensor_id).next_poll <= now + DUE_TOLERANCE
+        ]
+
+    def next_refresh_in(self, sensor_ids: list, now: float) -> float:
+        """Return seconds until the next sensor is due."""
+        if not sensor_ids:
+            return self._clamp(self.base_interval)
+        next_poll = min(self._schedule(sensor_id).next_poll for sensor_id in sensor_ids)
+        return self._clamp(next_poll - now)
+
+    def record_success(self, sensor_id: int, value: float, now: float) -> None:
+        """Update the cadence estimate from a successful poll."""
+        schedule = self._schedule(sensor_id)
+        schedule.failures = 0
+        last_poll, schedule.last_poll = schedule.last_poll, now
+
+        if last_poll is None:
+            schedule.last_value = value
+            schedule.next_poll = now + self._clamp(self.base_interval)
+            return
+
+        if value != schedule.last_value:
+            # The update happened somewhere since the previous poll
+            changed = (last_poll + now) / 2
+            if schedule.cadence is not None:
+                predicted = schedule.last_change + schedule.cadence - PHASE_STEP
+                if predicted > last_poll:
+                    # Seen on the first poll, so it may have come earlier than
+                    # predicted: shift the phase estimate earlier a little
+                    changed = min(predicted, now)
+            if schedule.last_change is not None:
+                interval = changed - schedule.last_change
+                if schedule.cadence is None:
+                    schedule.cadence = interval
+                else:
+                    schedule.cadence += CADENCE_SMOOTHING * (interval - schedule.cadence)
+            schedule.last_change = changed
+            schedule.last_value = value
+            schedule.stable_polls = 0
+
+        if schedule.cadence is None:
+            # Not enough changes seen yet to know the cadence
+            delay = self.base_interval
+            if value == schedule.last_value and schedule.last_change is None:
+                delay *= STABLE_BACKOFF ** schedule.stable_polls
+                schedule.stable_polls += 1
+            schedule.next_poll = now + self._clamp(delay)
+            return
+
+        expected = schedule.last_change + schedule.cadence + POLL_MARGIN
+        if expected > now:
+            # Next update not due yet, poll just after it
+            schedule.next_poll = now + self._clamp(expected - now)
+        else:
+            # Overdue, check again soon and back off gradually up to the cadence
+            delay = min(self.min_interval * STABLE_BACKOFF ** schedule.stable_polls, schedule.cadence)
+            schedule.stable_polls += 1
+            schedule.next_poll = now + self._clamp(delay)
+
+    def record_failure(self, sensor_id: int, now: float) -> None:
+        """Back off after a failed poll."""
+        schedule = self._schedule(sensor_id)
+        schedule.failures += 1
+        delay = self.base_interval * FAILURE_BACKOFF ** (schedule.failures - 1)
+        schedule.next_poll = now + self._clamp(delay)
+
+    def forget(self, sensor_id: int) -> None:
+        """Drop the schedule for a sensor."""
+        self._schedules.pop(sensor_id, None)
@@ -1,29 +1,25 @@
 """Sensor entities for Loggamera integration."""
 
-import asyncio
 import logging
-import re
-from datetime import datetime, timedelta
-from homeassistant.util import dt as dt_util
+from datetime import datetime
 from typing import Any
 
-import aiohttp
-from bs4 import BeautifulSoup
-
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTemperature, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, SENSORS, DEVICE_IDENTIFIER, DEVICE_NAME, DEVICE_MANUFACTURER, DEVICE_MODEL, DEVICE_SW_VERSION
+from .const import (
+    DOMAIN,
+    SENSORS,
+    DEFAULT_RECORD_VOLATILE_ATTRIBUTES,
+)
+from .coordinator import LoggameraDataCoordinator
+from .entity import hub_device_info, lake_device_info
+from .metrics import TIMING_PHASES, RESPONSE_BYTES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,147 +30,139 @@ async def async_setup_entry(
 ) -> None:
     """Set up Loggamera sensors from config entry."""
     
-    # Get session for API calls
-    session = async_get_clientsession(hass)
-    
-    # Get configuration
-    config_data = hass.data[DOMAIN][config_entry.entry_id]
-    selected_sensors = config_data["sensors"]
-    scan_interval_seconds = config_data["scan_interval"]
-    scan_interval = timedelta(seconds=scan_interval_seconds)
-    
-    # Create coordinator for managing updates
-    coordinator = LoggameraDataCoordinator(hass, session, selected_sensors, scan_interval)
-    
-    # Initial data fetch
-    try:
-        await coordinator.async_config_entry_first_refresh()
-        _LOGGER.info("Initial data fetch successful")
-    except Exception as err:
-        _LOGGER.warning(f"Initial data fetch failed: {err}")
+    # Coordinator is created and refreshed in __init__.async_setup_entry
+    runtime = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = runtime.coordinator
+    selected_sensors = coordinator.sensor_ids
     
     # Create entities
     entities = []
     
-    # Add temperature sensors for selected lakes
+    # Add temperature sensors for selected lakes and any other Loggamera ids
     for sensor_id in selected_sensors:
-        if sensor_id in SENSORS:
-            entities.append(LoggameraTemperatureSensor(
-                coordinator,
-                sensor_id,
-                SENSORS[sensor_id]
-            ))
+        entities.extend(_lake_entities(coordinator, sensor_id))
     
     # Add last updated sensor
     entities.append(LoggameraLastUpdatedSensor(coordinator))
     
-    # Add status sensor
-    entities.append(LoggameraStatusSensor(coordinator, config_entry))
+    # Add status sensor; volatile attributes stay out of the recorder
+    # unless asked for
+    if runtime.config.get("record_volatile_attributes", DEFAULT_RECORD_VOLATILE_ATTRIBUTES):
+        entities.append(LoggameraRecordedStatusSensor(coordinator, config_entry))
+    else:
+        entities.append(LoggameraStatusSensor(coordinator, config_entry))
     
-    # Store entities in hass.data for number entity to access
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
-    hass.data[DOMAIN]["entities"] = entities
-    hass.data[DOMAIN]["coordinator"] = coordinator
+    # Add timing diagnostics when metrics are collected
+    if coordinator.metrics is not None:
+        for metric in (*TIMING_PHASES, RESPONSE_BYTES):
+            entities.append(LoggameraMetricSensor(coordinator, metric))
     
-    # Add all entities
-    async_add_entities(entities, True)
-
-class LoggameraDataCoordinator(DataUpdateCoordinator):
-    """Manages data fetching for all Loggamera sensors."""
-    
-    def __init__(self, hass: HomeAssistant, session: aiohttp.ClientSession, sensor_ids: list, scan_interval: timedelta):
-        """Initialize coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=scan_interval,
-        )
-        self.session = session
-        self.sensor_ids = sensor_ids
-        self.data = {}
-        self.last_update = None
-        
-        # Status tracking
-        self.status = "Starting..."
-        self.last_error = None
-        self.successful_updates = 0
-        self.failed_updates = 0
-        
-    async def _async_update_data(self):
-        """Fetch data from all sensors."""
-        new_data = {}
-        errors = []
-        success_count = 0
-        
-        for sensor_id in self.sensor_ids:
-            try:
-                temperature = await self._fetch_temperature(sensor_id)
-                new_data[sensor_id] = {
-                    'temperature': temperature,
-                    'available': True,
-                    'last_update': datetime.now()
-                }
-                success_count += 1
-                _LOGGER.debug(f"Successfully fetched {temperature}°C for sensor {sensor_id}")
-            except Exception as err:
-                _LOGGER.warning(f"Failed to fetch data for sensor {sensor_id}: {err}")
-                errors.append(f"Sensor {sensor_id}: {str(err)}")
-                new_data[sensor_id] = {
-                    'temperature': None,
-                    'available': False,
-                    'last_update': self.data.get(sensor_id, {}).get('last_update')
-                }
-        
-        # Update status
-        if success_count == len(self.sensor_ids):
-            self.status = "OK"
-            self.last_error = None
-            self.successful_updates += 1
-        elif success_count > 0:
-            self.status = "Partial"
-            self.last_error = f"Some sensors failed: {'; '.join(errors)}"
-            self.failed_updates += 1
-        else:
-            self.status = "Error"
-            self.last_error = f"All sensors failed: {'; '.join(errors)}"
-            self.failed_updates += 1
+    # Keep the entry's entities with its runtime data
+    runtime.entities = entities
+    
+    # Add all entities; the coordinator already holds data, so skip the
+    # per-entity update that would otherwise request a refresh for each one
+    async_add_entities(entities)
+    
+    # Add temperature sensors for ids added while running
+    known_sensors = set(selected_sensors)
+    
+    @callback
+    def _async_add_temperature_sensors() -> None:
+        # Forget removed ids so they get a new entity if added back
+        known_sensors.intersection_update(coordinator.sensor_ids)
+        new_entities = []
+        for sensor_id in coordinator.sensor_ids:
+            if sensor_id in known_sensors:
+                continue
+            known_sensors.add(sensor_id)
+            new_entities.extend(_lake_entities(coordinator, sensor_id))
+        if new_entities:
+            runtime.entities.extend(new_entities)
+            async_add_entities(new_entities)
+    
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_temperature_sensors))
+    
+    # Add an entity for every other value found on the pages, including
+    # values that first appear in a later refresh
+    if coordinator.extract_all_values:
+        known_readings = set()
         
-        self.data = new_data
-        self.last_update = dt_util.now()
+        @callback
+        def _async_add_reading_sensors() -> None:
+            known_readings.difference_update(
+                {key for key in known_readings if key[0] not in coordinator.sensor_ids}
+            )
+            new_entities = []
+            for sensor_id, sensor_data in coordinator.data.items():
+                for reading in sensor_data.get('readings') or []:
+                    if (sensor_id, reading['key']) in known_readings:
+                        continue
+                    known_readings.add((sensor_id, reading['key']))
+                    new_entities.append(LoggameraReadingSensor(
+                        coordinator,
+                        sensor_id,
+                        SENSORS.get(sensor_id, f"Loggamera {sensor_id}"),
+                        reading
+                    ))
+            if new_entities:
+                runtime.entities.extend(new_entities)
+                async_add_entities(new_entities)
         
-        return self.data
+        _async_add_reading_sensors()
+        config_entry.async_on_unload(coordinator.async_add_listener(_async_add_reading_sensors))
+
+def _lake_entities(coordinator: LoggameraDataCoordinator, sensor_id: int) -> list:
+    """Return the temperature entity of a lake and its derived statistics entities."""
+    lake_name = SENSORS.get(sensor_id, f"Loggamera {sensor_id}")
+    entities = [LoggameraTemperatureSensor(coordinator, sensor_id, lake_name)]
+    if coordinator.series is not None:
+        for kind in DERIVED_KINDS:
+            entities.append(LoggameraDerivedSensor(coordinator, sensor_id, lake_name, kind))
+    return entities
+
+class LoggameraCoordinatorEntity(CoordinatorEntity):
+    """Coordinator entity that only writes its state when it has changed.
+
+    Attributes listed in ``_volatile_attributes`` are shown with the next
+    write but do not cause one on their own.
+    """
     
-    async def _fetch_temperature(self, location_id: int) -> float:
-        """Fetch temperature for a specific location."""
-        url = "https://portal.loggamera.se/PublicViews/OverviewInside"
-        data = {"id": location_id}
-        
-        try:
-            async with self.session.post(url, data=data, timeout=10) as response:
-                response.raise_for_status()
-                html = await response.text()
-                
-                soup = BeautifulSoup(html, 'html.parser')
-                temp_elements = soup.find_all(class_='display-value')
-                
-                for element in temp_elements:
-                    temp_text = element.get_text().strip()
-                    temp_match = re.search(r'([-+]?\d*\.?\d+)', temp_text)
-                    if temp_match:
-                        temp_value = float(temp_match.group(1))
-                        if -5 <= temp_value <= 40:  # Reasonable range
-                            return temp_value
-                
-                raise UpdateFailed("No valid temperature found in response")
-                
-        except asyncio.TimeoutError:
-            raise UpdateFailed("Timeout while fetching data")
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Network error: {err}")
+    _volatile_attributes: frozenset[str] = frozenset()
+    _written_state = None
+    # Entities of one Loggamera id are also updated as soon as its fetch finishes
+    sensor_id: int | None = None
+    
+    def _state_fingerprint(self) -> tuple:
+        """Return everything about the state that is worth a write."""
+        attrs = self.extra_state_attributes or {}
+        return (
+            self.available,
+            self.native_value,
+            self.name,
+            self.icon,
+            {key: value for key, value in attrs.items() if key not in self._volatile_attributes},
+        )
+    
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the entity was added."""
+        await super().async_added_to_hass()
+        self._written_state = self._state_fingerprint()
+        if self.sensor_id is not None:
+            self.async_on_remove(
+                self.coordinator.async_add_sensor_listener(self.sensor_id, self._handle_coordinator_update)
+            )
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if it differs from the last write."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._written_state:
+            return
+        self._written_state = fingerprint
+        self.async_write_ha_state()
 
-class LoggameraTemperatureSensor(CoordinatorEntity, SensorEntity):
+class LoggameraTemperatureSensor(LoggameraCoordinatorEntity, SensorEntity):
     """Temperature sensor for a specific lake."""
     
     def __init__(self, coordinator: LoggameraDataCoordinator, sensor_id: int, lake_name: str):
@@ -184,7 +172,7 @@ class LoggameraTemperatureSensor(CoordinatorEntity, SensorEntity):
         self.lake_name = lake_name
         
         self._attr_name = f"{lake_name} Badtemperatur"
-        self._attr_unique_id = f"{DOMAIN}_{sensor_id}_temperature"
+        self._attr_unique_id = f"{coordinator.entry_id}_{sensor_id}_temperature"
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -193,13 +181,7 @@ class LoggameraTemperatureSensor(CoordinatorEntity, SensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, DEVICE_IDENTIFIER)},
-            name=DEVICE_NAME,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL,
-            sw_version=DEVICE_SW_VERSION,
-        )
+        return lake_device_info(self.coordinator.entry_id, self.sensor_id)
     
     @property
     def native_value(self) -> float | None:
@@ -213,7 +195,155 @@ class LoggameraTemperatureSensor(CoordinatorEntity, SensorEntity):
         sensor_data = self.coordinator.data.get(self.sensor_id, {})
         return sensor_data.get('available', False)
 
-class LoggameraLastUpdatedSensor(CoordinatorEntity, SensorEntity):
+# Derived statistics sensors: name suffix, unit, icon
+DERIVED_KINDS = {
+    "mean": ("Medeltemperatur", UnitOfTemperature.CELSIUS, "mdi:thermometer"),
+    "rate": ("Uppvärmningstakt", "°C/h", "mdi:thermometer-chevron-up"),
+    "trend": ("Trend", None, "mdi:trending-up"),
+    "day_min": ("Dygnets lägsta", UnitOfTemperature.CELSIUS, "mdi:thermometer-low"),
+    "day_max": ("Dygnets högsta", UnitOfTemperature.CELSIUS, "mdi:thermometer-high"),
+}
+
+class LoggameraDerivedSensor(LoggameraCoordinatorEntity, SensorEntity):
+    """Statistic computed from a lake's recent readings kept in memory."""
+    
+    def __init__(self, coordinator: LoggameraDataCoordinator, sensor_id: int, lake_name: str, kind: str):
+        """Initialize derived sensor."""
+        super().__init__(coordinator)
+        self.sensor_id = sensor_id
+        self.kind = kind
+        
+        suffix, unit, icon = DERIVED_KINDS[kind]
+        self._attr_name = f"{lake_name} {suffix}"
+        self._attr_unique_id = f"{coordinator.entry_id}_{sensor_id}_{kind}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+        if unit == UnitOfTemperature.CELSIUS:
+            self._attr_device_class = SensorDeviceClass.TEMPERATURE
+        if unit is not None:
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+    
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return lake_device_info(self.coordinator.entry_id, self.sensor_id)
+    
+    @property
+    def native_value(self) -> float | str | None:
+        """Return the statistic."""
+        series = self.coordinator.series.get(self.sensor_id)
+        if series is None:
+            return None
+        if self.kind == "mean":
+            value = series.mean
+        elif self.kind == "rate":
+            value = series.rate
+        elif self.kind == "trend":
+            return series.trend
+        elif self.kind == "day_min":
+            value = series.today()[0]
+        else:
+            value = series.today()[1]
+        return round(value, 2) if value is not None else None
+    
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.native_value is not None
+
+class LoggameraReadingSensor(LoggameraCoordinatorEntity, SensorEntity):
+    """Sensor for any other labeled value shown on a Loggamera page."""
+    
+    def __init__(self, coordinator: LoggameraDataCoordinator, sensor_id: int, lake_name: str, reading: dict):
+        """Initialize reading sensor."""
+        super().__init__(coordinator)
+        self.sensor_id = sensor_id
+        self.key = reading['key']
+        
+        label = reading.get('label') or self.key
+        self._attr_name = f"{lake_name} {label}"
+        self._attr_unique_id = f"{coordinator.entry_id}_{sensor_id}_reading_{self.key}"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = reading.get('unit')
+        self._attr_icon = "mdi:gauge"
+    
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return lake_device_info(self.coordinator.entry_id, self.sensor_id)
+    
+    def _reading(self) -> dict | None:
+        """Return this entity's reading from the latest page, if present."""
+        sensor_data = self.coordinator.data.get(self.sensor_id, {})
+        for reading in sensor_data.get('readings') or []:
+            if reading['key'] == self.key:
+                return reading
+        return None
+    
+    @property
+    def native_value(self) -> float | None:
+        """Return the reading value."""
+        reading = self._reading()
+        return reading['value'] if reading else None
+    
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        sensor_data = self.coordinator.data.get(self.sensor_id, {})
+        return sensor_data.get('available', False) and self._reading() is not None
+
+class LoggameraMetricSensor(LoggameraCoordinatorEntity, SensorEntity):
+    """Diagnostic sensor showing the median of a refresh phase over recent fetches."""
+    
+    def __init__(self, coordinator: LoggameraDataCoordinator, metric: str):
+        """Initialize metric sensor."""
+        super().__init__(coordinator)
+        self.metric = metric
+        
+        self._attr_name = f"Tid {metric}" if metric in TIMING_PHASES else "Svarsstorlek"
+        self._attr_unique_id = f"{coordinator.entry_id}_metric_{metric}"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        if metric in TIMING_PHASES:
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+            self._attr_icon = "mdi:timer-outline"
+        else:
+            self._attr_device_class = SensorDeviceClass.DATA_SIZE
+            self._attr_native_unit_of_measurement = UnitOfInformation.BYTES
+            self._attr_icon = "mdi:file-download-outline"
+    
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return hub_device_info(self.coordinator.entry_id)
+    
+    def _summary(self) -> dict:
+        """Return the overall summary for this metric."""
+        return self.coordinator.metrics.summary(metric=self.metric).get(self.metric, {})
+    
+    @property
+    def native_value(self) -> float | None:
+        """Return the median over the rolling window."""
+        return self._summary().get("p50")
+    
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return tail percentiles, overall and per sensor."""
+        summary = self._summary()
+        attrs = {
+            "p95": summary.get("p95"),
+            "p99": summary.get("p99"),
+            "matningar": summary.get("samples", 0),
+        }
+        for sensor_id in self.coordinator.sensor_ids:
+            sensor_summary = self.coordinator.metrics.summary(sensor_id, self.metric).get(self.metric)
+            if sensor_summary is not None:
+                attrs[f"sensor_{sensor_id}_p50"] = sensor_summary["p50"]
+                attrs[f"sensor_{sensor_id}_p95"] = sensor_summary["p95"]
+        return attrs
+
+class LoggameraLastUpdatedSensor(LoggameraCoordinatorEntity, SensorEntity):
     """Sensor showing when data was last updated."""
     
     def __init__(self, coordinator: LoggameraDataCoordinator):
@@ -221,20 +351,14 @@ class LoggameraLastUpdatedSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         
         self._attr_name = "Senast Uppdaterad"
-        self._attr_unique_id = f"{DOMAIN}_last_updated"
+        self._attr_unique_id = f"{coordinator.entry_id}_last_updated"
         self._attr_device_class = SensorDeviceClass.TIMESTAMP
         self._attr_icon = "mdi:clock-check"
         
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, DEVICE_IDENTIFIER)},
-            name=DEVICE_NAME,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL,
-            sw_version=DEVICE_SW_VERSION,
-        )
+        return hub_device_info(self.coordinator.entry_id)
     
     @property
     def native_value(self) -> datetime | None:
@@ -246,15 +370,29 @@ class LoggameraLastUpdatedSensor(CoordinatorEntity, SensorEntity):
         """Return if entity is available."""
         return self.coordinator.last_update is not None
 
-class LoggameraStatusSensor(CoordinatorEntity, SensorEntity):
+class LoggameraStatusSensor(LoggameraCoordinatorEntity, SensorEntity):
     """Sensor showing system status and errors."""
     
+    # Change with every refresh; shown in the UI but not worth a write
+    # or a recorder row of their own
+    _volatile_attributes = frozenset({
+        "senast_uppdaterad",
+        "lyckade_uppdateringar",
+        "misslyckade_uppdateringar",
+        "parsning_blockerade_ms",
+        "cache_traffar",
+        "cache_missar",
+        "delade_hamtningar",
+        "uppstart_ms",
+    })
+    _unrecorded_attributes = _volatile_attributes
+    
     def __init__(self, coordinator: LoggameraDataCoordinator, config_entry: ConfigEntry):
         """Initialize status sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
         
-        self._attr_unique_id = f"{DOMAIN}_status"
+        self._attr_unique_id = f"{coordinator.entry_id}_status"
         self._attr_icon = "mdi:check-network"
     
     @property
@@ -268,13 +406,7 @@ class LoggameraStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, DEVICE_IDENTIFIER)},
-            name=DEVICE_NAME,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL,
-            sw_version=DEVICE_SW_VERSION,
-        )
+        return hub_device_info(self.coordinator.entry_id)
     
     @property
     def native_value(self) -> str:
@@ -311,7 +443,7 @@ class LoggameraStatusSensor(CoordinatorEntity, SensorEntity):
         # Basic attributes always shown
         attrs = {
             "senast_uppdaterad": self.coordinator.last_update,
-            "uppdateringsintervall_sekunder": self.coordinator.update_interval.total_seconds(),
+            "uppdateringsintervall_sekunder": self.coordinator.scan_interval,
         }
         
         # Debug attributes only shown when debug mode is on
@@ -319,6 +451,18 @@ class LoggameraStatusSensor(CoordinatorEntity, SensorEntity):
             attrs.update({
                 "lyckade_uppdateringar": self.coordinator.successful_updates,
                 "misslyckade_uppdateringar": self.coordinator.failed_updates,
+                "parsning_blockerade_ms": round(self.coordinator.loop_blocked_seconds * 1000, 1),
+                "cache_traffar": self.coordinator.cache.hits,
+                "cache_missar": self.coordinator.cache.misses,
+                "delade_hamtningar": self.coordinator.client.inflight.shared,
+                "avvisade_varden": (
+                    sum(validator.rejected for validator in self.coordinator.validators.values())
+                    if self.coordinator.validators is not None else None
+                ),
+                "uppstart_ms": (
+                    round(self.coordinator.setup_seconds * 1000)
+                    if self.coordinator.setup_seconds is not None else None
+                ),
             })
             
             if self.coordinator.last_error:
@@ -333,10 +477,18 @@ class LoggameraStatusSensor(CoordinatorEntity, SensorEntity):
                 )
                 if sensor_data.get('temperature') is not None:
                     attrs[f"{clean_name}_temperatur"] = f"{sensor_data['temperature']}°C"
+                breaker = self.coordinator.breakers.get(sensor_id)
+                if breaker is not None:
+                    attrs[f"{clean_name}_krets"] = breaker.state
         
         return attrs
     
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return True  # Status sensor is always available 
\ No newline at end of file
+        return True  # Status sensor is always available
+
+class LoggameraRecordedStatusSensor(LoggameraStatusSensor):
+    """Status sensor that also records its volatile attributes."""
+    
+    _unrecorded_attributes = frozenset()
@@ -0,0 +1,139 @@
+"""In-memory reading series with incremental statistics."""
+
+from array import array
+from datetime import date
+
+from homeassistant.util import dt as dt_util
+
+from .const import SERIES_SIZE, TREND_THRESHOLD
+
+SECONDS_PER_HOUR = 3600
+
+TREND_RISING = "stigande"
+TREND_FALLING = "sjunkande"
+TREND_STABLE = "stabil"
+
+
+class ReadingSeries:
+    """Fixed-size ring buffer of recent readings for one sensor.
+
+    Timestamps and temperatures live in two preallocated ``array('d')``
+    buffers. Running sums are updated as readings are added and evicted,
+    so the mean and least-squares slope cost O(1) per sample. Times are
+    kept in hours from an origin that moves to the oldest reading each
+    time the buffer wraps, when the sums are also recomputed to shed
+    accumulated rounding error.
+    """
+
+    __slots__ = (
+        "size", "count", "_times", "_values", "_start", "_origin",
+        "_sum_t", "_sum_v", "_sum_tt", "_sum_tv",
+        "day", "day_min", "day_max",
+    )
+
+    def __init__(self, size: int = SERIES_SIZE):
+        """Initialize series."""
+        self.size = size
+        self.count = 0
+        self._times = array("d", bytes(8 * size))
+        self._values = array("d", bytes(8 * size))
+        self._start = 0
+        self._origin = None
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        self.day: date | None = None
+        self.day_min = None
+        self.day_max = None
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a reading in epoch seconds, evicting the oldest when full."""
+        if self._origin is None:
+            self._origin = timestamp
+        hours = (timestamp - self._origin) / SECONDS_PER_HOUR
+
+        if self.count == self.size:
+            index = self._start
+            self._remove(self._times[index], self._values[index])
+            self._start = (self._start + 1) % self.size
+        else:
+            index = (self._start + self.count) % self.size
+            self.count += 1
+        self._times[index] = hours
+        self._values[index] = value
+        self._sum_t += hours
+        self._sum_v += value
+        self._sum_tt += hours * hours
+        self._sum_tv += hours * value
+
+        if self._start == 0 and self.count == self.size:
+            self._rebase()
+
+        day = dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date()
+        if day != self.day:
+            self.day = day
+            self.day_min = self.day_max = value
+        else:
+            self.day_min = min(self.day_min, value)
+            self.day_max = max(self.day_max, value)
+
+    def _remove(self, hours: float, value: float) -> None:
+        """Take an evicted reading out of the running sums."""
+        self._sum_t -= hours
+        self._sum_v -= value
+        self._sum_tt -= hours * hours
+        self._sum_tv -= hours * value
+
+    def _rebase(self) -> None:
+        """Move the origin to the oldest reading and recompute the sums."""
+        shift = self._times[self._start]
+        self._origin += shift * SECONDS_PER_HOUR
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        for index in range(self.size):
+            hours = self._times[index] - shift
+            value = self._values[index]
+            self._times[index] = hours
+            self._sum_t += hours
+            self._sum_v += value
+            self._sum_tt += hours * hours
+            self._sum_tv += hours * value
+
+    @property
+    def latest(self) -> float | None:
+        """Return the most recent reading."""
+        if not self.count:
+            return None
+        return self._values[(self._start + self.count - 1) % self.size]
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the readings in the buffer."""
+        if not self.count:
+            return None
+        return self._sum_v / self.count
+
+    @property
+    def rate(self) -> float | None:
+        """Return the least-squares slope in degrees per hour."""
+        if self.count < 2:
+            return None
+        denominator = self.count * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 1e-9:
+            return None
+        return (self.count * self._sum_tv - self._sum_t * self._sum_v) / denominator
+
+    @property
+    def trend(self) -> str | None:
+        """Return whether the temperature is rising, falling or stable."""
+        rate = self.rate
+        if rate is None:
+            return None
+        if rate >= TREND_THRESHOLD:
+            return TREND_RISING
+        if rate <= -TREND_THRESHOLD:
+            return TREND_FALLING
+        return TREND_STABLE
+
+    def today(self) -> tuple[float | None, float | None]:
+        """Return today's (min, max), or Nones if there is no reading today."""
+        if self.day != dt_util.now().date():
+            return None, None
+        return self.day_min, self.day_max
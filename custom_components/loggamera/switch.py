@@ -7,7 +7,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 
-from .const import DOMAIN, DEVICE_IDENTIFIER, DEVICE_NAME, DEVICE_MANUFACTURER, DEVICE_MODEL, DEVICE_SW_VERSION
+from .const import DOMAIN
+from .entity import hub_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,31 +20,26 @@ async def async_setup_entry(
     """Set up Loggamera switch entities."""
     
     # Create debug switch entity
-    async_add_entities([LoggameraDebugSwitch(config_entry)], True)
+    runtime = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities([LoggameraDebugSwitch(runtime)], True)
 
 class LoggameraDebugSwitch(SwitchEntity):
     """Switch entity for enabling debug mode."""
 
-    def __init__(self, config_entry: ConfigEntry):
+    def __init__(self, runtime):
         """Initialize the switch entity."""
-        self._config_entry = config_entry
+        self._runtime = runtime
         self._attr_name = "Debug Läge"
-        self._attr_unique_id = f"{DOMAIN}_debug_mode"
+        self._attr_unique_id = f"{runtime.entry.entry_id}_debug_mode"
         self._attr_icon = "mdi:bug"
         
         # Get initial state from config entry (default off)
-        self._is_on = config_entry.data.get("debug_mode", False)
+        self._is_on = runtime.debug_mode
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, DEVICE_IDENTIFIER)},
-            name=DEVICE_NAME,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL,
-            sw_version=DEVICE_SW_VERSION,
-        )
+        return hub_device_info(self._runtime.entry.entry_id)
 
     @property
     def is_on(self) -> bool:
@@ -52,13 +48,7 @@ class LoggameraDebugSwitch(SwitchEntity):
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on debug mode."""
-        # Update config entry data
-        new_data = dict(self._config_entry.data)
-        new_data["debug_mode"] = True
-        
-        self.hass.config_entries.async_update_entry(
-            self._config_entry, data=new_data
-        )
+        self._runtime.async_set_debug_mode(True)
         
         self._is_on = True
         self.async_write_ha_state()
@@ -67,13 +57,7 @@ class LoggameraDebugSwitch(SwitchEntity):
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off debug mode."""
-        # Update config entry data
-        new_data = dict(self._config_entry.data)
-        new_data["debug_mode"] = False
-        
-        self.hass.config_entries.async_update_entry(
-            self._config_entry, data=new_data
-        )
+        self._runtime.async_set_debug_mode(False)
         
         self._is_on = False
         self.async_write_ha_state()
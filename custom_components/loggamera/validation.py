@@ -0,0 +1,82 @@
+"""Outlier rejection for Loggamera readings."""
+
+from collections import deque
+from statistics import median
+
+from .const import OUTLIER_WINDOW, OUTLIER_THRESHOLD, OUTLIER_MIN_SPREAD
+
+# Scales the median absolute deviation to a standard deviation
+MAD_SCALE = 1.4826
+# Consecutive rejected readings that agree with each other are taken as a
+# real change in level and accepted
+MAX_CONSECUTIVE_REJECTS = 3
+# Readings needed before anything is rejected
+MIN_SAMPLES = 5
+
+
+class ReadingValidator:
+    """Hampel filter over a sensor's recent accepted readings.
+
+    A reading is rejected when it is further than ``threshold`` scaled
+    median absolute deviations from the median of the window, with the
+    deviation floored at ``min_spread`` degrees so a flat series does not
+    reject every small change. The portal often shows the same value for
+    several polls, so a repeated value is only judged again when it comes
+    from a newly parsed page. Otherwise an accepted repeat is accepted
+    without being added to the window again, and a rejected repeat is
+    rejected without counting towards MAX_CONSECUTIVE_REJECTS, so a
+    single glitch left on the page is never taken as a change in level.
+    """
+
+    __slots__ = ("threshold", "min_spread", "_window", "_last", "_last_accepted", "_rejected", "rejected")
+
+    def __init__(self, window: int = OUTLIER_WINDOW, threshold: float = OUTLIER_THRESHOLD, min_spread: float = OUTLIER_MIN_SPREAD):
+        """Initialize validator."""
+        self.threshold = threshold
+        self.min_spread = min_spread
+        self._window = deque(maxlen=window)
+        self._last = None
+        self._last_accepted = True
+        self._rejected = []
+        self.rejected = 0
+
+    def accept(self, value: float, new_sample: bool = False) -> bool:
+        """Return True if the reading is plausible, updating the window.
+
+        ``new_sample`` marks a value parsed from a new page, which is
+        judged even when it equals the previous value.
+        """
+        if value == self._last and not new_sample:
+            return self._last_accepted
+        self._last = value
+        self._last_accepted = self._check(value)
+        if self._last_accepted:
+            self._rejected.clear()
+            self._window.append(value)
+        else:
+            self.rejected += 1
+        return self._last_accepted
+
+    def filter(self, values) -> list[bool]:
+        """Validate a batch of readings in order and return a mask of accepted ones."""
+        return [self.accept(value) for value in values]
+
+    def _check(self, value: float) -> bool:
+        """Return True if value is within the Hampel limits."""
+        if len(self._window) < MIN_SAMPLES:
+            return True
+        center = median(self._window)
+        spread = max(MAD_SCALE * median(abs(sample - center) for sample in self._window), self.min_spread)
+        if abs(value - center) <= self.threshold * spread:
+            return True
+
+        # Several rejected readings close to each other mean the level moved
+        self._rejected.append(value)
+        if len(self._rejected) >= MAX_CONSECUTIVE_REJECTS:
+            rejected_center = median(self._rejected)
+            if all(abs(sample - rejected_center) <= self.threshold * self.min_spread for sample in self._rejected):
+                self._window.clear()
+                self._window.extend(self._rejected[:-1])
+                return True
+            del self._rejected[0]
+        return False
@@ -0,0 +1,70 @@
+"""Shared fixtures for the Loggamera tests."""
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.loggamera.const import DOMAIN
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Let Home Assistant load the integration in every test."""
+    yield
+
+
+@pytest.fixture
+async def portal(socket_enabled):
+    """Run a local portal simulator for the duration of a test."""
+    from .portal import PortalSimulator
+
+    simulator = PortalSimulator()
+    await simulator.start()
+    yield simulator
+    await simulator.stop()
+
+
+@pytest.fixture
+def unlimited_client(hass):
+    """Create the shared client so every request goes straight to the portal.
+
+    Requests do not wait for rate limiter tokens and results are not
+    reused between fetches.
+    """
+    from custom_components.loggamera.client import async_get_client
+    from custom_components.loggamera.ratelimit import TokenBucket
+
+    client = async_get_client(hass)
+    client.limiter = TokenBucket(rate=None)
+    client.inflight.freshness = 0
+    return client
+
+
+@pytest.fixture
+def make_entry(hass, portal):
+    """Return a function that adds an entry polling the portal simulator."""
+
+    def _make_entry(sensors: list[int], version: int = 3, options: dict | None = None, **data) -> MockConfigEntry:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            version=version,
+            title=f"Loggamera {sensors}",
+            data={"sensors": sensors, "scan_interval": 300, "portal_url": portal.url, **data},
+            options=options or {},
+        )
+        entry.add_to_hass(hass)
+        return entry
+
+    return _make_entry
+
+
+@pytest.fixture
+def setup_entry(hass, make_entry):
+    """Return a function that adds and sets up an entry polling the portal simulator."""
+
+    async def _setup_entry(sensors: list[int], **kwargs) -> MockConfigEntry:
+        entry = make_entry(sensors, **kwargs)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        return entry
+
+    return _setup_entry
@@ -0,0 +1,64 @@
+"""Local stand-in for the Loggamera OverviewInside page."""
+
+import asyncio
+import random
+
+from aiohttp import web
+
+
+class PortalSimulator:
+    """Serve OverviewInside pages with configurable latency and faults.
+
+    Each id reads ``15 + id % 10`` degrees unless ``temperatures`` says
+    otherwise. Ids in ``slow`` take that many extra seconds, ids in
+    ``held`` are not answered until their event is set, ids in
+    ``failing`` answer 500, and ``error_rate`` fails a random share of all
+    requests. ``padding`` adds bytes after the reading, like the real page.
+    """
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, padding: int = 0):
+        """Initialize simulator."""
+        self.latency = latency
+        self.error_rate = error_rate
+        self.padding = padding
+        self.temperatures: dict[int, float] = {}
+        self.slow: dict[int, float] = {}
+        self.held: dict[int, asyncio.Event] = {}
+        self.failing: set[int] = set()
+        self.requests: list[int] = []
+        self.url = None
+        self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        sensor_id = int((await request.post())["id"])
+        self.requests.append(sensor_id)
+        await asyncio.sleep(self.latency + self.slow.get(sensor_id, 0.0))
+        if sensor_id in self.held:
+            await self.held[sensor_id].wait()
+        if sensor_id in self.failing or random.random() < self.error_rate:
+            return web.Response(status=500, text="Server error")
+        temperature = self.temperatures.get(sensor_id, 15 + sensor_id % 10)
+        return web.Response(
+            content_type="text/html",
+            text=(
+                f"<html><body><h4>Vattentemperatur</h4><div class=\"display-value\">{temperature} °C</div>"
+                f"<h4>Lufttemperatur</h4><div class=\"display-value\">21,5 °C</div>"
+                f"<!-- {'x' * self.padding} --></body></html>"
+            ),
+        )
+
+    async def start(self) -> str:
+        """Start serving on a free local port and return the page address."""
+        app = web.Application()
+        app.router.add_post("/PublicViews/OverviewInside", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/PublicViews/OverviewInside"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        await self._runner.cleanup()
@@ -0,0 +1,49 @@
+"""Tests for the import_statistics service."""
+
+import pytest
+from homeassistant.components.recorder import statistics
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.loggamera.const import DOMAIN
+
+
+@pytest.fixture
+def imported(monkeypatch):
+    """Collect imported statistics instead of writing them to the recorder."""
+    calls = []
+    monkeypatch.setattr(statistics, "async_import_statistics", lambda hass, metadata, rows: calls.append((metadata, rows)))
+    return calls
+
+
+@pytest.fixture
+def dump(tmp_path):
+    """Write a reading every ten minutes for two hours to a CSV dump."""
+    path = tmp_path / "vattern.csv"
+    rows = [f"{1782900000 + minute * 600},{15 + minute / 10}" for minute in range(13)]
+    path.write_text("timestamp,temperature\n" + "\n".join(rows) + "\n")
+    return str(path)
+
+
+async def test_statistics_go_to_the_polling_entry(hass, setup_entry, imported, dump):
+    entry = await setup_entry([22])
+
+    await hass.services.async_call(DOMAIN, "import_statistics", {"sensor_id": 22, "path": dump}, blocking=True)
+
+    entity_id = er.async_get(hass).async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_22_temperature")
+    assert [metadata["statistic_id"] for metadata, _ in imported] == [entity_id]
+    assert len(imported[0][1]) == 3
+
+
+async def test_entry_is_chosen_when_several_poll_the_sensor(hass, setup_entry, imported, dump):
+    await setup_entry([22])
+    second = await setup_entry([22, 31])
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(DOMAIN, "import_statistics", {"sensor_id": 22, "path": dump}, blocking=True)
+
+    await hass.services.async_call(
+        DOMAIN, "import_statistics", {"sensor_id": 22, "path": dump, "config_entry_id": second.entry_id}, blocking=True
+    )
+    entity_id = er.async_get(hass).async_get_entity_id("sensor", DOMAIN, f"{second.entry_id}_22_temperature")
+    assert [metadata["statistic_id"] for metadata, _ in imported] == [entity_id]
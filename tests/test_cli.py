@@ -0,0 +1,34 @@
+"""Tests for the command line poller."""
+
+import json
+
+from custom_components.loggamera.__main__ import async_poll, parse_ids
+
+
+def test_parse_ids():
+    assert parse_ids(["21,22", "100-102 22"]) == [21, 22, 100, 101, 102]
+
+
+async def test_poll_writes_one_row_per_id(portal, capsys):
+    portal.failing.add(3)
+    failed = await async_poll(list(range(1, 11)), 4, 5, "jsonl", portal.url, False)
+
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert failed == 1
+    assert sorted(row["id"] for row in rows) == list(range(1, 11))
+    assert {row["id"]: row["temperature"] for row in rows}[7] == 22
+    assert all(row["wait_ms"] == 0 for row in rows)
+
+
+async def test_rate_limits_requests_only_when_asked(portal, capsys):
+    await async_poll(list(range(40)), 16, 5, "jsonl", portal.url, False)
+    unlimited = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    await async_poll(list(range(40)), 16, 5, "jsonl", portal.url, False, rate=50, burst=10)
+    limited = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert all(row["wait_ms"] == 0 for row in unlimited)
+    # 10 go out at once, the others wait for a token
+    assert sum(1 for row in limited if row["wait_ms"] == 0) >= 10
+    assert any(row["wait_ms"] > 0 for row in limited)
+    assert sorted(row["id"] for row in limited) == list(range(40))
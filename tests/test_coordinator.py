@@ -0,0 +1,99 @@
+"""Tests for refreshing many sensors against the portal simulator."""
+
+import asyncio
+from collections import Counter
+
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
+
+from custom_components.loggamera.breaker import STATE_OPEN
+from custom_components.loggamera.const import BREAKER_FAILURE_THRESHOLD, DOMAIN
+from custom_components.loggamera.sensor import LoggameraCoordinatorEntity
+
+
+def _entity_id(hass, entry, sensor_id: int) -> str:
+    return er.async_get(hass).async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_{sensor_id}_temperature")
+
+
+def _state(hass, entry, sensor_id: int) -> str:
+    return hass.states.get(_entity_id(hass, entry, sensor_id)).state
+
+
+async def test_slow_sensor_does_not_hold_back_others(hass, portal, setup_entry, unlimited_client):
+    entry = await setup_entry([22, 31])
+    coordinator = hass.data[DOMAIN][entry.entry_id].coordinator
+    portal.temperatures = {22: 11.0, 31: 12.0}
+    portal.held[31] = asyncio.Event()
+    updated = asyncio.Event()
+    async_track_state_change_event(hass, [_entity_id(hass, entry, 22)], callback(lambda event: updated.set()))
+
+    refresh = asyncio.create_task(coordinator.async_refresh())
+    await asyncio.wait_for(updated.wait(), 10)
+    # 22 is written while the page of 31 is still on its way
+    assert _state(hass, entry, 22) == "11.0"
+    assert _state(hass, entry, 31) == "16.0"
+    assert not refresh.done()
+
+    portal.held[31].set()
+    await refresh
+    assert _state(hass, entry, 31) == "12.0"
+
+
+async def test_failing_sensor_opens_its_circuit(hass, portal, setup_entry, unlimited_client):
+    entry = await setup_entry([22, 31])
+    coordinator = hass.data[DOMAIN][entry.entry_id].coordinator
+    portal.failing.add(31)
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        await coordinator.async_refresh()
+    assert coordinator.breakers[31].state == STATE_OPEN
+    assert coordinator.status == "Partial"
+    sent = portal.requests.count(31)
+
+    # While open the sensor is skipped and the others keep updating
+    portal.temperatures[22] = 9.5
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert portal.requests.count(31) == sent
+    assert _state(hass, entry, 22) == "9.5"
+    assert _state(hass, entry, 31) == "unavailable"
+
+
+async def test_concurrent_refreshes_share_one_request(hass, portal, setup_entry, unlimited_client):
+    entry = await setup_entry([22])
+    coordinator = hass.data[DOMAIN][entry.entry_id].coordinator
+    portal.held[22] = asyncio.Event()
+    sent = len(portal.requests)
+
+    fetches = asyncio.gather(*(coordinator._fetch_limited(22) for _ in range(20)))
+    while len(portal.requests) == sent:
+        await asyncio.sleep(0.01)
+    portal.held[22].set()
+    results = await fetches
+
+    assert len(portal.requests) == sent + 1
+    assert set(results) == {17}
+
+
+async def test_each_fetch_updates_only_its_own_entities(hass, setup_entry, unlimited_client, monkeypatch):
+    updates = Counter()
+    handle_update = LoggameraCoordinatorEntity._handle_coordinator_update
+
+    def _count_update(entity):
+        updates[entity.entity_id] += 1
+        handle_update(entity)
+
+    monkeypatch.setattr(LoggameraCoordinatorEntity, "_handle_coordinator_update", callback(_count_update))
+    entry = await setup_entry(list(range(1, 21)), derived_sensors=True)
+    coordinator = hass.data[DOMAIN][entry.entry_id].coordinator
+
+    updates.clear()
+    await coordinator.async_refresh()
+
+    temperature = _entity_id(hass, entry, 7)
+    status = er.async_get(hass).async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_status")
+    # Once when its own fetch finished and once at the end of the refresh
+    assert updates[temperature] == 2
+    assert updates[status] == 1
+    assert max(updates.values()) == 2
@@ -0,0 +1,27 @@
+"""Tests for the devices created for each Loggamera id."""
+
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from custom_components.loggamera.const import DOMAIN, DEVICE_IDENTIFIER
+
+
+async def test_each_id_has_its_own_device(hass, setup_entry):
+    entry = await setup_entry([22, 31])
+
+    devices = dr.async_get(hass)
+    entities = er.async_get(hass)
+    hub = devices.async_get_device(identifiers={(DOMAIN, f"{entry.entry_id}_{DEVICE_IDENTIFIER}")})
+    lake = devices.async_get_device(identifiers={(DOMAIN, f"{entry.entry_id}_31")})
+    assert lake.name == "Loggamera 31"
+    assert lake.via_device_id == hub.id
+    assert devices.async_get_device(identifiers={(DOMAIN, f"{entry.entry_id}_22")}).name == "Lake Vättern"
+
+    temperature = entities.async_get(entities.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_31_temperature"))
+    status = entities.async_get(entities.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_status"))
+    assert temperature.device_id == lake.id
+    assert status.device_id == hub.id
+
+    await hass.services.async_call(
+        DOMAIN, "reconfigure", {"config_entry_id": entry.entry_id, "sensor_ids": [22]}, blocking=True
+    )
+    assert devices.async_get_device(identifiers={(DOMAIN, f"{entry.entry_id}_31")}) is None
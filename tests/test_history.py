@@ -0,0 +1,89 @@
+"""Tests for the persistent reading history."""
+
+from datetime import datetime
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+
+from custom_components.loggamera import history as history_module
+from custom_components.loggamera.history import LoggameraHistory
+
+
+@pytest.fixture
+def storage_dir(hass, tmp_path):
+    """Keep the journal in a temporary config directory."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / ".storage").mkdir()
+    return tmp_path / ".storage"
+
+
+async def test_readings_are_appended_and_reloaded(hass, storage_dir):
+    history = LoggameraHistory(hass, "entry", size=3)
+    await history.async_load()
+    for minute in range(5):
+        history.async_record(22, 15.0 + minute, datetime(2026, 7, 1, 12, minute))
+    history.async_record(21, 18.5, datetime(2026, 7, 1, 12, 0))
+    await history.async_flush()
+
+    journal = storage_dir / "loggamera.entry.history.csv"
+    assert len(journal.read_text().splitlines()) == 6
+
+    reloaded = LoggameraHistory(hass, "entry", size=3)
+    await reloaded.async_load()
+    assert [temperature for _, temperature in reloaded.readings(22)] == [17.0, 18.0, 19.0]
+    assert reloaded.latest()[21][1] == 18.5
+
+
+async def test_flush_appends_only_new_readings(hass, storage_dir):
+    history = LoggameraHistory(hass, "entry", size=100)
+    await history.async_load()
+    history.async_record(22, 15.0, datetime(2026, 7, 1, 12, 0))
+    await history.async_flush()
+    journal = storage_dir / "loggamera.entry.history.csv"
+    first = journal.read_text()
+
+    history.async_record(22, 15.5, datetime(2026, 7, 1, 12, 5))
+    await history.async_flush()
+    assert journal.read_text() == first + f"22,{round(datetime(2026, 7, 1, 12, 5).timestamp())},15.5\n"
+
+
+async def test_journal_is_compacted(hass, storage_dir, monkeypatch):
+    monkeypatch.setattr(history_module, "JOURNAL_COMPACT_FACTOR", 2)
+    history = LoggameraHistory(hass, "entry", size=4)
+    await history.async_load()
+    for minute in range(20):
+        history.async_record(22, float(minute), datetime(2026, 7, 1, 12, minute))
+        await history.async_flush()
+
+    journal = storage_dir / "loggamera.entry.history.csv"
+    assert len(journal.read_text().splitlines()) <= 8
+    reloaded = LoggameraHistory(hass, "entry", size=4)
+    await reloaded.async_load()
+    assert [temperature for _, temperature in reloaded.readings(22)] == [16.0, 17.0, 18.0, 19.0]
+
+
+async def test_json_history_is_migrated(hass, storage_dir, hass_storage):
+    hass_storage["loggamera.entry.history"] = {
+        "version": 1,
+        "key": "loggamera.entry.history",
+        "data": {"readings": {"22": [[1782900000, 14.5], [1782900300, 14.75]]}},
+    }
+    history = LoggameraHistory(hass, "entry")
+    await history.async_load()
+
+    assert history.readings(22) == [[1782900000, 14.5], [1782900300, 14.75]]
+    assert (storage_dir / "loggamera.entry.history.csv").read_text() == "22,1782900000,14.5\n22,1782900300,14.75\n"
+    assert "loggamera.entry.history" not in hass_storage
+
+
+async def test_failed_setup_stops_listening_for_shutdown(hass, storage_dir, portal, make_entry):
+    portal.failing.add(22)
+    entry = make_entry([22])
+    listeners = hass.bus.async_listeners().get(EVENT_HOMEASSISTANT_FINAL_WRITE, 0)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    assert hass.bus.async_listeners().get(EVENT_HOMEASSISTANT_FINAL_WRITE, 0) == listeners
@@ -0,0 +1,63 @@
+"""Load tests with many Loggamera ids in one entry against the portal simulator.
+
+Setup and refresh cost are measured with debug mode off, which would
+otherwise record a stack trace for every callback and dominate the
+figures, and include the simulator serving the pages in the same
+process. They are reported as test properties (``--junitxml``) and
+printed with ``-s`` rather than asserted, so a loaded machine cannot
+fail the test; memory is asserted against a generous bound.
+"""
+
+import time
+import tracemalloc
+
+import pytest
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from custom_components.loggamera.const import DOMAIN
+
+IDS = 500
+MAX_SETUP_MIB = 64
+
+
+@pytest.fixture
+def sensor_ids(hass, unlimited_client):
+    """Return the ids to poll, with loop debugging off for the measurement."""
+    hass.loop.set_debug(False)
+    return list(range(1, IDS + 1))
+
+
+async def test_setup_and_refresh_time(hass, portal, setup_entry, sensor_ids, record_property):
+    started = time.process_time()
+    entry = await setup_entry(sensor_ids)
+    setup_seconds = time.process_time() - started
+    coordinator = hass.data[DOMAIN][entry.entry_id].coordinator
+
+    started = time.process_time()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    refresh_seconds = time.process_time() - started
+
+    record_property("setup_cpu_seconds", round(setup_seconds, 3))
+    record_property("refresh_cpu_seconds", round(refresh_seconds, 3))
+    print(f"\n{IDS} ids: setup {setup_seconds:.2f} s, refresh {refresh_seconds:.2f} s of CPU")
+
+    devices = dr.async_get(hass).devices
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    assert len([device for device in devices.values() if entry.entry_id in device.config_entries]) == IDS + 1
+    assert len([entity for entity in entities if entity.unique_id.endswith("_temperature")]) == IDS
+    assert portal.requests.count(IDS) == 2
+    assert coordinator.status == "OK"
+
+
+async def test_setup_memory(hass, setup_entry, sensor_ids, record_property):
+    tracemalloc.start()
+    try:
+        await setup_entry(sensor_ids)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    record_property("setup_peak_mib", round(peak / 2**20, 1))
+    print(f"\n{IDS} ids: setup peak {peak / 2**20:.1f} MiB")
+    assert peak < MAX_SETUP_MIB * 2**20
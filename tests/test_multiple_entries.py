@@ -0,0 +1,52 @@
+"""Tests for running several config entries side by side."""
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.loggamera.const import DOMAIN
+
+
+async def test_entries_have_separate_entities(hass, portal, setup_entry):
+    first = await setup_entry([22, 21])
+    second = await setup_entry([22, 31])
+
+    registry = er.async_get(hass)
+    first_ids = {entity.unique_id for entity in er.async_entries_for_config_entry(registry, first.entry_id)}
+    second_ids = {entity.unique_id for entity in er.async_entries_for_config_entry(registry, second.entry_id)}
+    assert f"{first.entry_id}_22_temperature" in first_ids
+    assert f"{second.entry_id}_22_temperature" in second_ids
+    assert f"{second.entry_id}_31_temperature" in second_ids
+    assert not first_ids & second_ids
+
+    # Both entries read 22, but it is only fetched once
+    assert portal.requests.count(22) == 1
+    assert hass.states.get(registry.async_get_entity_id("sensor", DOMAIN, f"{second.entry_id}_31_temperature")).state == "16.0"
+
+    # Unloading one entry leaves the other running
+    assert await hass.config_entries.async_unload(first.entry_id)
+    assert second.state is ConfigEntryState.LOADED
+    await hass.config_entries.async_reload(second.entry_id)
+    assert second.state is ConfigEntryState.LOADED
+
+
+async def test_reconfigure_targets_one_entry(hass, setup_entry):
+    first = await setup_entry([22])
+    second = await setup_entry([21])
+
+    await hass.services.async_call(
+        DOMAIN, "reconfigure", {"config_entry_id": second.entry_id, "scan_interval": 600}, blocking=True
+    )
+    assert second.data["scan_interval"] == 600
+    assert first.data["scan_interval"] == 300
+
+
+async def test_version_1_entities_are_migrated(hass, make_entry):
+    entry = make_entry([22], version=1)
+    registry = er.async_get(hass)
+    old = registry.async_get_or_create("sensor", DOMAIN, "loggamera_22_temperature", config_entry=entry)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.version == 3
+    assert registry.async_get(old.entity_id).unique_id == f"{entry.entry_id}_22_temperature"
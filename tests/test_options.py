@@ -0,0 +1,67 @@
+"""Tests for the options flow."""
+
+import pytest
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.loggamera.const import DOMAIN
+from custom_components.loggamera.sensor import LoggameraRecordedStatusSensor
+
+# Each option in the form, a value to save and a check that the reloaded
+# entry uses it
+OPTIONS = [
+    ("request_timeout", 30.0, lambda runtime: runtime.coordinator.request_timeout == 30.0),
+    ("parse_in_executor", True, lambda runtime: runtime.coordinator.parse_in_executor),
+    ("adaptive_polling", True, lambda runtime: runtime.coordinator.scheduler is not None),
+    ("extract_all_values", True, lambda runtime: runtime.coordinator.extract_all_values),
+    ("collect_metrics", True, lambda runtime: runtime.coordinator.metrics is not None),
+    ("profile_startup", True, lambda runtime: runtime.coordinator.startup_profile is not None),
+    (
+        "record_volatile_attributes",
+        True,
+        lambda runtime: any(isinstance(entity, LoggameraRecordedStatusSensor) for entity in runtime.entities),
+    ),
+    ("derived_sensors", True, lambda runtime: runtime.coordinator.series is not None),
+    ("validate_readings", True, lambda runtime: runtime.coordinator.validators is not None),
+    ("outlier_window", 15, lambda runtime: runtime.coordinator.outlier_limits[0] == 15),
+    ("outlier_threshold", 5.0, lambda runtime: runtime.coordinator.outlier_limits[1] == 5.0),
+    ("outlier_min_spread", 1.5, lambda runtime: runtime.coordinator.outlier_limits[2] == 1.5),
+]
+
+
+@pytest.mark.parametrize(("key", "value", "applied"), OPTIONS, ids=[option[0] for option in OPTIONS])
+async def test_option_is_applied_after_reload(hass, setup_entry, key, value, applied):
+    entry = await setup_entry([22])
+    assert not applied(hass.data[DOMAIN][entry.entry_id])
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+    assert key in result["data_schema"].schema
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {key: value})
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    await hass.async_block_till_done()
+
+    assert entry.options[key] == value
+    assert applied(hass.data[DOMAIN][entry.entry_id])
+
+
+async def test_empty_portal_url_is_not_saved(hass, portal, setup_entry):
+    entry = await setup_entry([22], options={"portal_url": portal.url})
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert "portal_url" in result["data_schema"].schema
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {"portal_url": ""})
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    await hass.async_block_till_done()
+
+    assert "portal_url" not in entry.options
+
+
+async def test_runtime_settings_do_not_reload(hass, setup_entry):
+    entry = await setup_entry([22])
+    runtime = hass.data[DOMAIN][entry.entry_id]
+
+    runtime.async_set_debug_mode(True)
+    await hass.async_block_till_done()
+
+    assert hass.data[DOMAIN][entry.entry_id] is runtime
+    assert entry.data["debug_mode"] is True
@@ -0,0 +1,84 @@
+"""Tests for the streaming temperature extractor against saved pages."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from custom_components.loggamera.parser import TemperatureExtractor, extract_temperature
+
+FIXTURES = Path(__file__).parent / "fixtures"
+EXPECTED = {
+    "overview_vattern.html": 17.4,
+    "overview_nested.html": 12.5,
+    "overview_void_elements.html": -1.5,
+    "overview_script.html": 9.8,
+    "overview_out_of_range.html": -3.2,
+    "overview_no_reading.html": None,
+    "overview_decimal_comma.html": 17.2,
+}
+
+
+def _page(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def _beautifulsoup_temperature(html: str) -> float | None:
+    """Return the temperature the BeautifulSoup parser used to find."""
+    bs4 = pytest.importorskip("bs4")
+    for element in bs4.BeautifulSoup(html, "html.parser").find_all(class_="display-value"):
+        match = re.search(r"([-+]?\d*\.?\d+)", element.get_text().strip())
+        if match and -5 <= float(match.group(1)) <= 40:
+            return float(match.group(1))
+    return None
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_fixture_temperature(name):
+    assert extract_temperature(_page(name)) == EXPECTED[name]
+
+
+@pytest.mark.parametrize("name", sorted(set(EXPECTED) - {"overview_decimal_comma.html"}))
+def test_same_temperature_as_beautifulsoup(name):
+    assert extract_temperature(_page(name)) == _beautifulsoup_temperature(_page(name))
+
+
+def test_decimal_comma_is_read_as_a_decimal():
+    # BeautifulSoup parsing stopped at the comma and read 17,2 as 17
+    assert _beautifulsoup_temperature(_page("overview_decimal_comma.html")) == 17.0
+    assert extract_temperature(_page("overview_decimal_comma.html")) == 17.2
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_chunked_feed_matches_whole_page(name):
+    html = _page(name)
+    extractor = TemperatureExtractor()
+    for start in range(0, len(html), 7):
+        extractor.feed(html[start:start + 7])
+    extractor.close()
+    assert extractor.temperature == EXPECTED[name]
+
+
+def test_script_and_comments_are_not_read():
+    extractor = TemperatureExtractor(all_values=True)
+    extractor.feed(_page("overview_script.html"))
+    extractor.close()
+    assert extractor.temperature == 9.8
+    assert extractor.readings == []
+
+
+def test_void_elements_do_not_end_the_value_early():
+    extractor = TemperatureExtractor(all_values=True)
+    extractor.feed(_page("overview_void_elements.html"))
+    extractor.close()
+    assert [(reading["label"], reading["value"]) for reading in extractor.readings] == [("Lufttemperatur", 4.0)]
+
+
+def test_nested_values_are_read_whole():
+    extractor = TemperatureExtractor(all_values=True)
+    extractor.feed(_page("overview_nested.html"))
+    extractor.close()
+    assert extractor.temperature == 12.5
+    assert [(reading["key"], reading["value"], reading["unit"]) for reading in extractor.readings] == [
+        ("lufttemperatur", 19.0, "°C")
+    ]
@@ -0,0 +1,62 @@
+"""Tests for the shared request rate limiter."""
+
+import asyncio
+
+from custom_components.loggamera.client import async_close_client, async_get_client
+from custom_components.loggamera.config_flow import async_validate_sensor_ids
+from custom_components.loggamera.ratelimit import PRIORITY_INTERACTIVE, PRIORITY_POLL, TokenBucket
+
+
+async def test_requests_beyond_burst_wait_in_arrival_order():
+    order = []
+    bucket = TokenBucket(rate=50.0, burst=5)
+
+    async def take(index):
+        waited = await bucket.acquire()
+        order.append(index)
+        return waited
+
+    waits = await asyncio.gather(*(take(index) for index in range(30)))
+
+    # 5 tokens at once, then the other 25 one at a time as tokens are earned
+    assert waits[:5] == [0.0] * 5
+    assert all(waited > 0 for waited in waits[5:])
+    assert order == list(range(30))
+    assert bucket.granted == 30
+    assert bucket.queued == 25
+
+
+async def test_polls_overtake_queued_validation_requests():
+    order = []
+    bucket = TokenBucket(rate=100.0, burst=1)
+
+    async def take(priority, name):
+        await bucket.acquire(priority)
+        order.append(name)
+
+    await bucket.acquire()
+    tasks = [asyncio.create_task(take(PRIORITY_INTERACTIVE, f"validation{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(take(PRIORITY_POLL, "poll")))
+    await asyncio.gather(*tasks)
+
+    assert order[0] == "poll"
+
+
+async def test_unlimited_bucket_never_waits():
+    bucket = TokenBucket(rate=None)
+    waits = await asyncio.gather(*(bucket.acquire() for _ in range(500)))
+
+    assert not any(waits)
+    assert bucket.granted == 500
+    assert bucket.as_dict()["queue_depth"] == 0
+
+
+async def test_id_validation_takes_tokens_from_the_shared_limiter(hass, portal):
+    client = async_get_client(hass)
+    client.url = portal.url
+    portal.failing.add(31)
+
+    assert await async_validate_sensor_ids(hass, [22, 31]) == [31]
+    assert client.limiter.granted == 2
+    await async_close_client(hass)
@@ -0,0 +1,37 @@
+"""Tests for the entities of other values shown on a page."""
+
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.loggamera.const import DOMAIN
+from custom_components.loggamera.parser import TemperatureExtractor
+
+PAGE = (
+    '<h4>Vattentemperatur</h4><div class="display-value">17,2 °C</div>'
+    '<h4>Lufttemperatur</h4><div class="display-value">21,5 °C</div>'
+    '<h4>Temperature</h4><div class="display-value">3 m</div>'
+)
+
+
+def test_main_temperature_is_not_repeated_as_reading():
+    extractor = TemperatureExtractor(all_values=True)
+    extractor.feed(PAGE)
+    extractor.close()
+
+    assert extractor.temperature == 17.2
+    assert [reading["key"] for reading in extractor.readings] == ["lufttemperatur", "temperature"]
+
+
+async def test_reading_ids_do_not_collide(hass, make_entry):
+    entry = make_entry([22], version=2, extract_all_values=True, derived_sensors=True)
+    registry = er.async_get(hass)
+    old_reading = registry.async_get_or_create("sensor", DOMAIN, f"{entry.entry_id}_22_lufttemperatur", config_entry=entry)
+    temperature = registry.async_get_or_create("sensor", DOMAIN, f"{entry.entry_id}_22_temperature", config_entry=entry)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert registry.async_get(old_reading.entity_id).unique_id == f"{entry.entry_id}_22_reading_lufttemperatur"
+    assert registry.async_get(temperature.entity_id).unique_id == f"{entry.entry_id}_22_temperature"
+    unique_ids = {entity.unique_id for entity in er.async_entries_for_config_entry(registry, entry.entry_id)}
+    assert f"{entry.entry_id}_22_reading_vattentemperatur" not in unique_ids
+    assert hass.states.get(old_reading.entity_id).state == "21.5"
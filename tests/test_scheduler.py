@@ -0,0 +1,74 @@
+"""Tests for the adaptive poll scheduler."""
+
+import pytest
+
+from custom_components.loggamera.const import MAX_SCAN_INTERVAL, MIN_SCAN_INTERVAL
+from custom_components.loggamera.scheduler import POLL_MARGIN, AdaptivePollScheduler
+
+
+def test_first_poll_waits_the_base_interval():
+    scheduler = AdaptivePollScheduler(300)
+    scheduler.record_success(22, 15.0, 0)
+    assert scheduler.next_refresh_in([22], 0) == 300
+    assert scheduler.due([22, 21], 0) == [21]
+
+
+def test_cadence_is_learned_from_changes():
+    scheduler = AdaptivePollScheduler(300)
+    scheduler.record_success(22, 15.0, 0)
+    # Changed somewhere between 0 and 1000, taken as 500
+    scheduler.record_success(22, 15.5, 1000)
+    assert scheduler.next_refresh_in([22], 1000) == 300
+    # Changed again around 1900, so updates come every 1400 seconds
+    scheduler.record_success(22, 16.0, 2800)
+    assert scheduler.next_refresh_in([22], 2800) == 1900 + 1400 + POLL_MARGIN - 2800
+
+
+def test_overdue_update_is_polled_for_with_growing_delays():
+    scheduler = AdaptivePollScheduler(300)
+    for value, now in ((15.0, 0), (15.5, 1000), (16.0, 2800)):
+        scheduler.record_success(22, value, now)
+    expected = 1900 + 1400 + POLL_MARGIN
+
+    scheduler.record_success(22, 16.0, expected)
+    assert scheduler.next_refresh_in([22], expected) == MIN_SCAN_INTERVAL
+    scheduler.record_success(22, 16.0, expected + 60)
+    assert scheduler.next_refresh_in([22], expected + 60) == pytest.approx(1.5 * MIN_SCAN_INTERVAL)
+
+
+def test_unchanged_sensor_backs_off():
+    scheduler = AdaptivePollScheduler(300)
+    now = 0
+    delays = []
+    for _ in range(4):
+        scheduler.record_success(22, 15.0, now)
+        delays.append(scheduler.next_refresh_in([22], now))
+        now += delays[-1]
+    assert delays == [300, 300, 450, 675]
+
+
+def test_failures_back_off_until_a_success():
+    scheduler = AdaptivePollScheduler(300)
+    delays = []
+    for now in (0, 300, 900):
+        scheduler.record_failure(22, now)
+        delays.append(scheduler.next_refresh_in([22], now))
+    assert delays == [300, 600, 1200]
+
+    scheduler.record_success(22, 15.0, 2100)
+    scheduler.record_failure(22, 2400)
+    assert scheduler.next_refresh_in([22], 2400) == 300
+
+
+def test_delays_stay_within_limits():
+    fast = AdaptivePollScheduler(10)
+    fast.record_success(22, 15.0, 0)
+    assert fast.next_refresh_in([22], 0) == MIN_SCAN_INTERVAL
+    # A sensor long overdue is polled after the shortest delay, not at once
+    assert fast.next_refresh_in([22], 10_000) == MIN_SCAN_INTERVAL
+
+    slow = AdaptivePollScheduler(MAX_SCAN_INTERVAL)
+    for _ in range(3):
+        slow.record_failure(22, 0)
+    assert slow.next_refresh_in([22], 0) == MAX_SCAN_INTERVAL
+    assert slow.next_refresh_in([], 0) == MAX_SCAN_INTERVAL
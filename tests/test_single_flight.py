@@ -0,0 +1,60 @@
+"""Tests for sharing concurrent fetches of the same key."""
+
+import asyncio
+
+import pytest
+
+from custom_components.loggamera.client import InFlightRegistry
+
+
+async def test_concurrent_runs_make_one_request():
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 12.5
+
+    registry = InFlightRegistry()
+    results = await asyncio.gather(*(registry.run(("temperature", 22), fetch) for _ in range(50)))
+
+    assert calls == 1
+    assert results == [12.5] * 50
+    assert registry.started == 1
+    assert registry.shared == 49
+
+
+async def test_cancelled_leader_does_not_cancel_followers():
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return 7.0
+
+    registry = InFlightRegistry()
+    leader = asyncio.create_task(registry.run("key", fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(registry.run("key", fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    assert await follower == 7.0
+    assert registry.started == 1
+
+
+async def test_failure_is_shared_and_not_cached():
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("broken page")
+
+    registry = InFlightRegistry()
+    results = await asyncio.gather(*(registry.run("key", fetch) for _ in range(5)), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+    await asyncio.gather(registry.run("key", fetch), return_exceptions=True)
+    assert calls == 2
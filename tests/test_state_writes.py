@@ -0,0 +1,37 @@
+"""Tests for the state writes, and so recorder rows, made by each refresh."""
+
+from collections import Counter
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.loggamera.const import DOMAIN
+
+
+async def test_unchanged_refreshes_write_no_states(hass, portal, setup_entry, unlimited_client):
+    entry = await setup_entry([22, 31], adaptive_polling=True)
+    coordinator = hass.data[DOMAIN][entry.entry_id].coordinator
+    writes = Counter()
+    hass.bus.async_listen(EVENT_STATE_CHANGED, callback(lambda event: writes.update([event.data["entity_id"]])))
+
+    # Each wake-up under adaptive polling moves the next one, and every id
+    # is fetched again although its reading stays the same
+    for _ in range(5):
+        coordinator.scheduler.forget(22)
+        coordinator.scheduler.forget(31)
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    registry = er.async_get(hass)
+    status = registry.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_status")
+    temperature = registry.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_22_temperature")
+    assert portal.requests.count(22) == 6
+    last_updated = registry.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_last_updated")
+    assert writes[status] == 0
+    assert writes[temperature] == 0
+    # Only the time of the last update is recorded, so at most one row per
+    # refresh and 288 a day at the 300 second interval
+    assert set(writes) <= {last_updated}
+    assert writes[last_updated] <= 5
+    assert hass.states.get(status).attributes["uppdateringsintervall_sekunder"] == 300
@@ -0,0 +1,37 @@
+"""Tests for the reading validator."""
+
+from custom_components.loggamera.validation import MAX_CONSECUTIVE_REJECTS, ReadingValidator
+
+STEADY = [15.0, 15.1, 14.9, 15.0, 15.2, 15.1, 14.8, 15.0, 15.1]
+
+
+def test_single_spike_is_rejected():
+    validator = ReadingValidator()
+    assert all(validator.filter(STEADY))
+    assert validator.accept(40.0) is False
+    assert validator.accept(15.0) is True
+    assert validator.rejected == 1
+
+
+def test_level_shift_is_accepted_after_distinct_samples():
+    validator = ReadingValidator()
+    validator.filter(STEADY)
+    verdicts = validator.filter([19.0, 19.1, 18.9, 19.0, 19.2])
+    assert verdicts[:MAX_CONSECUTIVE_REJECTS - 1] == [False] * (MAX_CONSECUTIVE_REJECTS - 1)
+    assert all(verdicts[MAX_CONSECUTIVE_REJECTS - 1:])
+    assert validator.rejected == MAX_CONSECUTIVE_REJECTS - 1
+
+
+def test_glitch_left_on_the_page_stays_rejected():
+    validator = ReadingValidator()
+    validator.filter(STEADY)
+    # The portal keeps showing one bad value for several polls
+    assert validator.filter([38.0] * 20 + [15.0]) == [False] * 20 + [True]
+    assert validator.rejected == 1
+
+
+def test_new_pages_with_the_same_value_count_as_samples():
+    validator = ReadingValidator()
+    validator.filter(STEADY)
+    verdicts = [validator.accept(19.0, new_sample=True) for _ in range(MAX_CONSECUTIVE_REJECTS)]
+    assert verdicts == [False] * (MAX_CONSECUTIVE_REJECTS - 1) + [True]